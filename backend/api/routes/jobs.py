@@ -1,5 +1,5 @@
 """Job search and management routes."""
-import json
+import asyncio
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
@@ -17,6 +17,9 @@ from datetime import datetime
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# One client for the process, so requests reuse its pooled HTTP connections
+job_api = UnifiedJobAPI()
+
 
 @router.post("/search", response_model=List[JobResponse])
 async def search_jobs(
@@ -30,15 +33,14 @@ async def search_jobs(
     This endpoint fetches jobs from multiple sources and stores them in the database.
     Falls back to mock data if API keys are not configured.
     """
-    # Try real APIs first
-    job_api = UnifiedJobAPI()
-    
     # Check if API keys are configured
     has_api_keys = (settings.JOOBLE_API_KEY or settings.ADZUNA_API_KEY)
     
     if has_api_keys:
-        # Use real job APIs
-        jobs_data = job_api.search_all_sources(
+        # Use real job APIs; the source rate limiters are shared with the
+        # scheduler and may sleep, so the search runs off the event loop
+        jobs_data = await asyncio.to_thread(
+            job_api.search_all_sources,
             keywords=search_params.keywords or "",
             location=search_params.location or "",
             limit=search_params.limit
@@ -83,10 +85,10 @@ async def search_jobs(
             source=job_data.get('source', 'LinkedIn'),
             source_url=job_data.get('source_url'),
             external_id=job_data.get('external_id'),
-            keywords=json.dumps(job_analysis.get('all_keywords', [])),
-            required_skills=json.dumps(job_analysis.get('required_skills', [])),
-            preferred_skills=json.dumps(job_analysis.get('preferred_skills', [])),
-            action_words=json.dumps(job_analysis.get('action_words', [])),
+            keywords=job_analysis.get('all_keywords', []),
+            required_skills=job_analysis.get('required_skills', []),
+            preferred_skills=job_analysis.get('preferred_skills', []),
+            action_words=job_analysis.get('action_words', []),
             salary_range=job_data.get('salary_range'),
             posted_date=job_data.get('posted_date', datetime.utcnow()),
         )
@@ -1,9 +1,13 @@
 """Database setup and session management."""
-from sqlalchemy import create_engine
+import json
+import logging
+from sqlalchemy import JSON, String, create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from backend.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -29,5 +33,73 @@ def get_db():
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips tables that already exist, so add any index
+    # declared since they were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    _migrate_json_columns()
+
+
+def _migrate_json_columns():
+    """
+    Convert legacy TEXT columns to JSON on PostgreSQL.
+    
+    Columns declared JSON used to be Text holding json.dumps output, and
+    create_all never alters existing tables. SQLite stores JSON as text so it
+    needs nothing, but PostgreSQL would keep returning plain strings.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name']: column['type'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if isinstance(column.type, JSON) and isinstance(existing.get(column.name), String):
+                    _repair_json_text(conn, table, column.name)
+                    name = quote(column.name)
+                    conn.execute(text(
+                        f"ALTER TABLE {quote(table.name)} ALTER COLUMN {name} TYPE JSON USING {name}::json"
+                    ))
+
+
+def _repair_json_text(conn, table, column_name: str):
+    """
+    Make every value of a legacy TEXT column castable to JSON.
+    
+    A single malformed row would otherwise abort the ALTER and with it
+    startup. Blank values become NULL; any other text that is not valid
+    JSON is kept as a one-item list holding the original string.
+    """
+    quote = engine.dialect.identifier_preparer.quote
+    table_name, name = quote(table.name), quote(column_name)
+    key = quote(next(iter(table.primary_key.columns)).name)
+    
+    repaired = []
+    rows = conn.execute(text(f"SELECT {key}, {name} FROM {table_name} WHERE {name} IS NOT NULL"))
+    for row_id, value in rows.all():
+        if not value.strip():
+            repaired.append({'id': row_id, 'value': None})
+            continue
+        try:
+            # PostgreSQL's json type rejects NaN/Infinity, which Python accepts
+            json.loads(value, parse_constant=_reject_json_constant)
+        except ValueError:
+            repaired.append({'id': row_id, 'value': json.dumps([value])})
+    
+    if repaired:
+        logger.warning(
+            "Repairing %d non-JSON values in %s.%s (ids: %s)",
+            len(repaired), table.name, column_name, ', '.join(str(row['id']) for row in repaired)
+        )
+        conn.execute(text(f"UPDATE {table_name} SET {name} = :value WHERE {key} = :id"), repaired)
 
 
+def _reject_json_constant(constant: str):
+    """json.loads hook that treats NaN/Infinity as malformed."""
+    raise ValueError(f"Invalid JSON constant: {constant}")
@@ -0,0 +1,45 @@
+"""Application logging setup."""
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Parent of every application logger (backend.services.*, backend.api.*)
+APP_LOGGER = 'backend'
+
+_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging():
+    """
+    Write application log records to stdout from a background thread.
+    
+    Only used when nothing has configured the root logger; otherwise records
+    propagate to the handlers already there. The handler just enqueues
+    records, so logging from the event loop never waits on stdout.
+    """
+    global _handler, _listener
+    if _listener is not None or logging.getLogger().handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    _handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _listener.start()
+    
+    app_logger = logging.getLogger(APP_LOGGER)
+    app_logger.addHandler(_handler)
+    app_logger.setLevel(logging.INFO)
+
+
+def shutdown_logging():
+    """Detach the stdout handler and flush its queue."""
+    global _handler, _listener
+    if _listener is None:
+        return
+    
+    logging.getLogger(APP_LOGGER).removeHandler(_handler)
+    _listener.stop()
+    _handler = _listener = None
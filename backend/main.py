@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from backend.core.config import settings
 from backend.core.database import init_db, engine
+from backend.core.logging_config import setup_logging, shutdown_logging
 from backend.models import User, Resume, Job, Application
 from backend.api.routes import auth, resumes, jobs, applications
 
@@ -14,6 +15,9 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting Resume Optimizer SaaS...")
     
+    # Route service log records (scheduler, application queue) to stdout
+    setup_logging()
+    
     # Create database tables
     init_db()
     print("✓ Database initialized")
@@ -31,6 +35,8 @@ async def lifespan(app: FastAPI):
         from backend.services.scheduler_service import job_scheduler
         job_scheduler.stop()
         print("✓ Job scheduler stopped")
+    
+    shutdown_logging()
 
 # Create FastAPI app with lifespan
 app = FastAPI(
@@ -1,5 +1,5 @@
 """Job model."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.core.database import Base
@@ -9,6 +9,10 @@ class Job(Base):
     """Job model for storing scraped job postings."""
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Stale-job cleanup filters on both columns
+        Index('ix_jobs_posted_active', 'posted_date', 'is_active'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -30,10 +34,10 @@ class Job(Base):
     external_id = Column(String, unique=True, index=True)  # Job ID from source
     
     # Parsed data
-    keywords = Column(Text)  # JSON list of extracted keywords
-    required_skills = Column(Text)  # JSON list
-    preferred_skills = Column(Text)  # JSON list
-    action_words = Column(Text)  # JSON list of action words in JD
+    keywords = Column(JSON(none_as_null=True))  # List of extracted keywords
+    required_skills = Column(JSON(none_as_null=True))  # List of skills
+    preferred_skills = Column(JSON(none_as_null=True))  # List of skills
+    action_words = Column(JSON(none_as_null=True))  # List of action words in JD
     
     # Metadata
     salary_range = Column(String)
@@ -1,5 +1,5 @@
 """User model."""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.core.database import Base
@@ -19,7 +19,7 @@ class User(Base):
     is_superuser = Column(Boolean, default=False)
     
     # Profile fields
-    target_roles = Column(String)  # JSON string of target job titles
+    target_roles = Column(JSON(none_as_null=True))  # List of target job titles
     industries = Column(String)  # JSON string of target industries
     experience_years = Column(Integer)
     
@@ -1,5 +1,6 @@
 """Job schemas."""
-from pydantic import BaseModel
+import json
+from pydantic import BaseModel, field_validator
 from typing import Optional, List
 from datetime import datetime
 
@@ -34,6 +35,12 @@ class JobResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
+    @field_validator('keywords', 'required_skills', 'preferred_skills', mode='before')
+    @classmethod
+    def _dump_json_list(cls, value):
+        """The columns hold lists; the API keeps serving them as JSON text."""
+        return value if value is None or isinstance(value, str) else json.dumps(value)
+    
     class Config:
         from_attributes = True
 
@@ -1,5 +1,6 @@
 """User schemas."""
-from pydantic import BaseModel, EmailStr
+import json
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional, List
 from datetime import datetime
 
@@ -30,6 +31,12 @@ class UserResponse(BaseModel):
     experience_years: Optional[int]
     created_at: datetime
     
+    @field_validator('target_roles', mode='before')
+    @classmethod
+    def _dump_json_list(cls, value):
+        """The column holds a list; the API keeps serving it as JSON text."""
+        return value if value is None or isinstance(value, str) else json.dumps(value)
+    
     class Config:
         from_attributes = True
 
@@ -1,15 +1,56 @@
 """Real job API integration for Jooble and Adzuna."""
 import requests
+import threading
 import time
 from typing import List, Dict, Optional
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from backend.core.config import settings
 
 
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared across threads.
+    
+    Up to ``capacity`` calls go through at once; after that, calls are spaced
+    out at ``refill_rate`` per second. Tokens are reserved under a lock, so
+    concurrent callers queue behind each other instead of waking together.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum burst size
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, n: float = 1):
+        """Block until n tokens are available."""
+        delay = self._reserve(n)
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _reserve(self, n: float) -> float:
+        """Take n tokens now and return the seconds until they are paid for."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= n
+            return -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+
 class JoobleAPI:
     """Jooble API integration for job search."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize Jooble API client.
         
@@ -17,6 +58,7 @@ class JoobleAPI:
         """
         self.api_key = api_key or getattr(settings, 'JOOBLE_API_KEY', '')
         self.base_url = "https://jooble.org/api/"
+        self.session = session or requests.Session()
     
     def search_jobs(
         self,
@@ -53,7 +95,7 @@ class JoobleAPI:
             payload["salary"] = salary
         
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.session.post(url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -93,7 +135,12 @@ class JoobleAPI:
 class AdzunaAPI:
     """Adzuna API integration for job search."""
     
-    def __init__(self, app_id: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Adzuna API client.
         
@@ -104,6 +151,7 @@ class AdzunaAPI:
         self.base_url = "https://api.adzuna.com/v1/api/jobs"
         # Default to US, can be changed to gb, ca, au, etc.
         self.country = getattr(settings, 'ADZUNA_COUNTRY', 'us')
+        self.session = session or requests.Session()
     
     def search_jobs(
         self,
@@ -151,7 +199,7 @@ class AdzunaAPI:
             params['full_time'] = 1 if full_time else 0
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -207,10 +255,24 @@ class AdzunaAPI:
 class UnifiedJobAPI:
     """Unified interface for multiple job APIs."""
     
+    # One limiter per upstream API, shared by every client in the process:
+    # bursts of 5 searches, then one every 2 seconds
+    jooble_limiter = TokenBucket(capacity=5, refill_rate=0.5)
+    adzuna_limiter = TokenBucket(capacity=5, refill_rate=0.5)
+    
     def __init__(self):
         """Initialize all job API clients."""
-        self.jooble = JoobleAPI()
-        self.adzuna = AdzunaAPI()
+        # One pooled HTTP session keeps connections (and TLS) alive across searches
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        
+        self.jooble = JoobleAPI(session=self._session)
+        self.adzuna = AdzunaAPI(session=self._session)
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._session.close()
     
     def search_all_sources(
         self,
@@ -235,6 +297,7 @@ class UnifiedJobAPI:
         
         # Try Jooble
         try:
+            self.jooble_limiter.acquire()
             jooble_jobs = self.jooble.search_jobs(
                 keywords=keywords,
                 location=location,
@@ -245,11 +308,9 @@ class UnifiedJobAPI:
         except Exception as e:
             print(f"Jooble search failed: {e}")
         
-        # Add delay to respect rate limits
-        time.sleep(1)
-        
         # Try Adzuna
         try:
+            self.adzuna_limiter.acquire()
             adzuna_jobs = self.adzuna.search_jobs(
                 keywords=keywords,
                 location=location,
@@ -1,13 +1,98 @@
 """NLP analysis service for job descriptions and resumes."""
 import re
+import sys
 import json
 from typing import List, Dict, Tuple
-from collections import Counter
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from types import MappingProxyType
+
+try:
+    # Third-party engine; supports atomic groups on every Python version
+    import regex as _skill_re
+    _ATOMIC_GROUPS = True
+except ImportError:
+    _skill_re = re
+    _ATOMIC_GROUPS = sys.version_info >= (3, 11)
+
+# Section headers are merged into one alternation so a single search finds
+# whichever header appears first instead of rescanning the text per header
+_REQUIRED_SECTION_RE = re.compile(
+    r'(?:requirements?|required|must have):(.+?)(?=responsibilities|qualifications|preferred|$)',
+    re.IGNORECASE | re.DOTALL
+)
+_PREFERRED_SECTION_RE = re.compile(
+    r'(?:preferred|nice to have|bonus):(.+?)(?=responsibilities|requirements|$)',
+    re.IGNORECASE | re.DOTALL
+)
+
+_EDUCATION_KEYWORDS = ('bachelor', 'master', 'phd', 'degree', 'bs', 'ms', 'ba', 'ma')
+
+
+def _trie_pattern(words) -> str:
+    """
+    Build a regex matching any of the words, shaped as a character trie.
+    
+    Shared prefixes are spelled out once, so at each position the engine
+    follows a single path instead of trying every word in turn. Longer
+    continuations come before a word's end, so the longest word wins.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # A word ends here
+    
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if '' in node:
+            branches.append(r'\b')
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie)
+
+
+@lru_cache(maxsize=32)
+def _skill_matcher(skills: Tuple[str, ...]):
+    """
+    Compile a skill list into a single word-boundary trie pattern.
+    
+    The trie prefers the longest skill at each position and is wrapped in an
+    atomic group so a near-miss prefix (e.g. 'pythonic' for 'python') fails
+    without backtracking. The scan runs inside a lookahead so overlapping
+    skills are all reported; skills nested in another skill at the same
+    position (e.g. 'rest' inside 'rest api') are recovered from the returned
+    ``nested`` map.
+    
+    Returns:
+        Tuple of (pattern, skill by casefolded text, nested skills by skill)
+    """
+    alternation = _trie_pattern(sorted({skill.lower() for skill in skills}))
+    if _ATOMIC_GROUPS:
+        alternation = '(?>' + alternation + ')'
+    pattern = _skill_re.compile(r'\b(?=(' + alternation + '))', _skill_re.IGNORECASE)
+    
+    by_folded = {skill.casefold(): skill for skill in skills}
+    nested = {}
+    for skill in skills:
+        inner = [
+            other for other in skills
+            if other != skill and re.search(r'\b' + re.escape(other) + r'\b', skill, re.IGNORECASE)
+        ]
+        if inner:
+            nested[skill] = inner
+    
+    return pattern, by_folded, nested
 
 
 class NLPAnalyzer:
     """Analyze job descriptions and resumes using NLP techniques."""
     
+    # No per-instance __dict__; the skill lists are read on every analysis
+    __slots__ = ('action_verbs', 'technical_skills', 'soft_skills')
+    
     def __init__(self):
         """Initialize the analyzer."""
         self.action_verbs = [
@@ -43,12 +128,19 @@ class NLPAnalyzer:
         """
         Analyze a job description to extract requirements and keywords.
         
+        Results are memoized, so a reposted description is only analyzed
+        once; each call gets its own copy to modify.
+        
         Args:
             description: Job description text
             
         Returns:
             Dictionary with analysis results
         """
+        return _thaw_analysis(_cached_job_analysis(self._skill_lists(), description))
+    
+    def _analyze_job_description(self, description: str) -> Dict:
+        """Uncached job description analysis behind analyze_job_description."""
         description_lower = description.lower()
         
         # Extract required and preferred skills
@@ -75,7 +167,7 @@ class NLPAnalyzer:
         
         # Calculate keyword frequency
         keywords = technical_skills + soft_skills + action_words
-        keyword_freq = Counter(keywords)
+        keyword_freq = self._keyword_frequency(keywords)
         
         return {
             'required_skills': required_skills,
@@ -86,10 +178,33 @@ class NLPAnalyzer:
             'experience_years': experience_years,
             'education_requirements': education_requirements,
             'key_phrases': key_phrases,
-            'keyword_frequency': dict(keyword_freq.most_common(20)),
-            'all_keywords': list(set(keywords))
+            'keyword_frequency': dict(nlargest(20, keyword_freq.items(), key=itemgetter(1))),
+            'all_keywords': list(keyword_freq)
         }
     
+    def analyze_many(self, descriptions: List[str]) -> List[Dict]:
+        """
+        Analyze a batch of job descriptions.
+        
+        Identical descriptions (reposts, the same posting from several
+        sources) are analyzed once; each gets its own copy of the result.
+        
+        Args:
+            descriptions: Job description texts
+            
+        Returns:
+            Analysis results, in the same order as the descriptions
+        """
+        skill_lists = self._skill_lists()
+        return [
+            _thaw_analysis(_cached_job_analysis(skill_lists, description))
+            for description in descriptions
+        ]
+    
+    def _skill_lists(self) -> Tuple[Tuple[str, ...], ...]:
+        """Hashable snapshot of the skill lists, part of the analysis cache key."""
+        return (tuple(self.technical_skills), tuple(self.soft_skills), tuple(self.action_verbs))
+    
     def analyze_resume(self, resume_text: str) -> Dict:
         """
         Analyze a resume to extract skills and experience.
@@ -114,15 +229,15 @@ class NLPAnalyzer:
         
         # Calculate keyword density
         keywords = technical_skills + soft_skills + action_words
-        keyword_freq = Counter(keywords)
+        keyword_freq = self._keyword_frequency(keywords)
         
         return {
             'technical_skills': technical_skills,
             'soft_skills': soft_skills,
             'action_words': action_words,
             'achievements': achievements,
-            'keyword_frequency': dict(keyword_freq.most_common(20)),
-            'all_keywords': list(set(keywords))
+            'keyword_frequency': dict(nlargest(20, keyword_freq.items(), key=itemgetter(1))),
+            'all_keywords': list(keyword_freq)
         }
     
     def calculate_match_score(self, resume_analysis: Dict, job_analysis: Dict) -> Tuple[float, Dict]:
@@ -187,58 +302,40 @@ class NLPAnalyzer:
         
         return round(total_score, 2), breakdown
     
+    @staticmethod
+    def _keyword_frequency(keywords: List[str]) -> Dict[str, int]:
+        """Count keywords in a single pass; keys keep first-seen order."""
+        freq = {}
+        for keyword in keywords:
+            freq[keyword] = freq.get(keyword, 0) + 1
+        return freq
+    
     def _extract_skills(self, text: str, skill_list: List[str]) -> List[str]:
         """Extract skills from text based on a skill list."""
-        found_skills = []
-        for skill in skill_list:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                found_skills.append(skill)
-        return found_skills
+        # One scan over the text instead of a word-boundary search per skill
+        pattern, by_folded, nested = _skill_matcher(tuple(skill_list))
+        found = set()
+        for match in pattern.finditer(text):
+            skill = by_folded.get(match.group(1).casefold())
+            if skill is not None:
+                found.add(skill)
+                found.update(nested.get(skill, ()))
+        return [skill for skill in skill_list if skill in found]
     
     def _extract_required_skills(self, text: str) -> List[str]:
         """Extract required skills from job description."""
-        required_section = ""
-        
         # Look for requirements section
-        patterns = [
-            r'requirements?:(.+?)(?=responsibilities|qualifications|preferred|$)',
-            r'required:(.+?)(?=responsibilities|qualifications|preferred|$)',
-            r'must have:(.+?)(?=responsibilities|qualifications|preferred|$)',
-        ]
-        
-        text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                required_section = match.group(1)
-                break
-        
-        if required_section:
-            return self._extract_skills(required_section, self.technical_skills)
+        match = _REQUIRED_SECTION_RE.search(text.lower())
+        if match:
+            return self._extract_skills(match.group(1), self.technical_skills)
         return []
     
     def _extract_preferred_skills(self, text: str) -> List[str]:
         """Extract preferred/optional skills from job description."""
-        preferred_section = ""
-        
         # Look for preferred section
-        patterns = [
-            r'preferred:(.+?)(?=responsibilities|requirements|$)',
-            r'nice to have:(.+?)(?=responsibilities|requirements|$)',
-            r'bonus:(.+?)(?=responsibilities|requirements|$)',
-        ]
-        
-        text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                preferred_section = match.group(1)
-                break
-        
-        if preferred_section:
-            return self._extract_skills(preferred_section, self.technical_skills)
+        match = _PREFERRED_SECTION_RE.search(text.lower())
+        if match:
+            return self._extract_skills(match.group(1), self.technical_skills)
         return []
     
     def _extract_experience_years(self, text: str) -> int:
@@ -251,15 +348,8 @@ class NLPAnalyzer:
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract education requirements."""
-        education_keywords = ['bachelor', 'master', 'phd', 'degree', 'bs', 'ms', 'ba', 'ma']
         text_lower = text.lower()
-        
-        found = []
-        for keyword in education_keywords:
-            if keyword in text_lower:
-                found.append(keyword)
-        
-        return list(set(found))
+        return [keyword for keyword in _EDUCATION_KEYWORDS if keyword in text_lower]
     
     def _extract_achievements(self, text: str) -> List[str]:
         """Extract quantifiable achievements from resume."""
@@ -295,3 +385,32 @@ class NLPAnalyzer:
         return found_phrases
 
 
+@lru_cache(maxsize=4096)
+def _cached_job_analysis(skill_lists: Tuple[Tuple[str, ...], ...], description: str) -> MappingProxyType:
+    """
+    Memoized job description analysis, stored in immutable form.
+    
+    Keyed on the skill lists as well as the text, so analyzers with
+    customized lists never share results with the defaults. Lists are kept
+    as tuples and mappings behind read-only proxies, so no caller can change
+    what later callers get; _thaw_analysis makes the mutable copy.
+    """
+    analyzer = NLPAnalyzer.__new__(NLPAnalyzer)
+    analyzer.technical_skills, analyzer.soft_skills, analyzer.action_verbs = map(list, skill_lists)
+    analysis = analyzer._analyze_job_description(description)
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict)
+        else tuple(value) if isinstance(value, list)
+        else value
+        for key, value in analysis.items()
+    })
+
+
+def _thaw_analysis(analysis: MappingProxyType) -> Dict:
+    """Fresh dict/list copy of a cached analysis."""
+    return {
+        key: dict(value) if isinstance(value, MappingProxyType)
+        else list(value) if isinstance(value, tuple)
+        else value
+        for key, value in analysis.items()
+    }
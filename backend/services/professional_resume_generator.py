@@ -1,19 +1,233 @@
 """Professional Resume Generator with modern formatting."""
+import io
 import json
+from copy import deepcopy
+from types import SimpleNamespace
 from typing import Dict, Optional, List
 from pathlib import Path
-from datetime import datetime
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, HRFlowable
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-from reportlab.lib import colors
+from backend.services.resume_common import default_basename, format_executor, load_once, pdf_lib
+
+try:
+    # C parser, several times faster than json on large experience arrays
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _pdf_lib() -> SimpleNamespace:
+    """The shared reportlab names plus this generator's colour palette."""
+    return load_once('professional_pdf', _build_pdf_lib)
+
+
+def _build_pdf_lib() -> SimpleNamespace:
+    """Extend pdf_lib() with the palette, built once instead of per style/flowable."""
+    rl = pdf_lib()
+    return SimpleNamespace(
+        **vars(rl),
+        COLOR_DARK=rl.colors.HexColor('#1a1a1a'),
+        COLOR_ACCENT=rl.colors.HexColor('#2c5aa0'),  # Professional blue
+        COLOR_SECONDARY=rl.colors.HexColor('#555555'),
+        COLOR_BODY=rl.colors.HexColor('#333333'),
+    )
+
+
+def _docx_lib() -> SimpleNamespace:
+    """Import python-docx on first use and return the names the DOCX builder needs."""
+    return load_once('professional_docx', _import_docx)
+
+
+def _import_docx() -> SimpleNamespace:
+    """Import python-docx and build the cached DOCX template."""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import Pt, Cm, RGBColor
+    
+    lib = SimpleNamespace(
+        Document=Document,
+        WD_ALIGN_PARAGRAPH=WD_ALIGN_PARAGRAPH,
+        # Bottom rule under section headings, copied into each heading
+        section_border=parse_xml(
+            f'<w:pBdr {nsdecls("w")}>'
+            '<w:bottom w:val="single" w:sz="6" w:space="1" w:color="2c5aa0"/>'
+            '</w:pBdr>'
+        ),
+        Pt=Pt,
+        Cm=Cm,
+        RGB_DARK=RGBColor(26, 26, 26),
+        RGB_ACCENT=RGBColor(44, 90, 160),
+        RGB_SECONDARY=RGBColor(85, 85, 85),
+    )
+    lib.template = _build_docx_template(lib)
+    return lib
+
+
+# Paragraph styles registered in the DOCX template, so paragraphs pick up
+# their formatting by name instead of having every run edited:
+# (name, based on, size in points, bold, italic, palette colour, centered)
+_DOCX_STYLES = (
+    ('RMName', 'Normal', 20, True, False, 'RGB_DARK', True),
+    ('RMContact', 'Normal', 10, False, False, 'RGB_SECONDARY', True),
+    ('RMSectionHeading', 'Normal', 12, True, False, 'RGB_ACCENT', False),
+    ('RMJobTitle', 'Normal', 11, True, False, None, False),
+    ('RMCompany', 'Normal', 10, False, True, 'RGB_SECONDARY', False),
+    ('RMBody', 'Normal', 10, False, False, None, False),
+    ('RMBullet', 'List Bullet', 10, False, False, None, False),
+)
+
+
+def _build_docx_template(lib: SimpleNamespace) -> bytes:
+    """
+    Serialize a blank document with the resume page setup and styles applied.
+    
+    Every DOCX starts as a copy of these bytes, so the page margins and the
+    _DOCX_STYLES are written once per process instead of on every document.
+    """
+    from docx.enum.style import WD_STYLE_TYPE
+    
+    doc = lib.Document()
+    for section in doc.sections:
+        section.top_margin = lib.Cm(1.5)
+        section.bottom_margin = lib.Cm(1.5)
+        section.left_margin = lib.Cm(2)
+        section.right_margin = lib.Cm(2)
+    
+    styles = doc.styles
+    for name, base, size, bold, italic, color, centered in _DOCX_STYLES:
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles[base]
+        style.font.size = lib.Pt(size)
+        style.font.bold = bold
+        style.font.italic = italic
+        if color:
+            style.font.color.rgb = getattr(lib, color)
+        if centered:
+            style.paragraph_format.alignment = lib.WD_ALIGN_PARAGRAPH.CENTER
+    
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+# Resume fields stored as JSON strings in the database
+_JSON_FIELDS = ('skills', 'experience', 'education', 'projects', 'certifications')
+
+# Sections whose entries carry a free-text description rendered as bullets
+_BULLET_SECTIONS = ('experience', 'education', 'projects')
+
+# Contact fields shown on the PDF/DOCX contact line, in order
+_CONTACT_FIELDS = ('email', 'phone', 'location')
+
+# Underline for plain-text section headings
+_TXT_RULE = "-" * 40
+
+# Section plans keyed by resume shape (which sections are filled in)
+_SECTION_PLANS = {}
+
+# Shared across generator instances; the stylesheet never depends on resume data
+_STYLES_CACHE = {}
+
+
+def _get_pdf_styles() -> Dict:
+    """Build the PDF paragraph styles once and return the cached set."""
+    if _STYLES_CACHE:
+        return _STYLES_CACHE
+    
+    _STYLES_CACHE.update(_build_pdf_styles())
+    return _STYLES_CACHE
+
+
+def _build_pdf_styles() -> Dict:
+    """Construct the paragraph styles used by the PDF generator."""
+    rl = _pdf_lib()
+    ParagraphStyle = rl.ParagraphStyle
+    styles = rl.getSampleStyleSheet()
+    
+    # Define professional styles
+    name_style = ParagraphStyle(
+        'Name',
+        parent=styles['Heading1'],
+        fontSize=22,
+        textColor=rl.COLOR_DARK,
+        spaceAfter=6,
+        alignment=rl.TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    contact_style = ParagraphStyle(
+        'Contact',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=rl.COLOR_SECONDARY,
+        spaceAfter=12,
+        alignment=rl.TA_CENTER,
+        fontName='Helvetica'
+    )
+    
+    section_heading_style = ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=13,
+        textColor=rl.COLOR_ACCENT,
+        spaceBefore=14,
+        spaceAfter=8,
+        fontName='Helvetica-Bold',
+        borderWidth=0,
+        borderPadding=0,
+        borderColor=rl.COLOR_ACCENT,
+        underlineWidth=2,
+    )
+    
+    job_title_style = ParagraphStyle(
+        'JobTitle',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=rl.COLOR_DARK,
+        spaceAfter=2,
+        fontName='Helvetica-Bold'
+    )
+    
+    company_style = ParagraphStyle(
+        'Company',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=rl.COLOR_SECONDARY,
+        spaceAfter=4,
+        fontName='Helvetica-Oblique'
+    )
+    
+    body_style = ParagraphStyle(
+        'Body',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=rl.COLOR_BODY,
+        spaceAfter=4,
+        fontName='Helvetica',
+        leading=14
+    )
+    
+    bullet_style = ParagraphStyle(
+        'Bullet',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=rl.COLOR_BODY,
+        spaceAfter=3,
+        leftIndent=20,
+        fontName='Helvetica',
+        leading=13
+    )
+    
+    return {
+        'name': name_style,
+        'contact': contact_style,
+        'section_heading': section_heading_style,
+        'job_title': job_title_style,
+        'company': company_style,
+        'body': body_style,
+        'bullet': bullet_style,
+    }
 
 
 class ProfessionalResumeGenerator:
@@ -26,229 +240,50 @@ class ProfessionalResumeGenerator:
     
     def generate_pdf(self, resume_data: Dict, filename: Optional[str] = None) -> str:
         """Generate a professional PDF resume with modern formatting."""
+        resume_data = self._normalize(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.pdf"
+            filename = f"{default_basename()}.pdf"
         
         filepath = self.output_dir / filename
+        rl = _pdf_lib()
         
         # Create PDF with A4 size
-        doc = SimpleDocTemplate(
+        doc = rl.SimpleDocTemplate(
             str(filepath),
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.6*inch,
-            bottomMargin=0.6*inch
+            pagesize=rl.letter,
+            rightMargin=0.75*rl.inch,
+            leftMargin=0.75*rl.inch,
+            topMargin=0.6*rl.inch,
+            bottomMargin=0.6*rl.inch
         )
         
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Define professional styles
-        name_style = ParagraphStyle(
-            'Name',
-            parent=styles['Heading1'],
-            fontSize=22,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        contact_style = ParagraphStyle(
-            'Contact',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#555555'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        )
-        
-        section_heading_style = ParagraphStyle(
-            'SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=13,
-            textColor=colors.HexColor('#2c5aa0'),
-            spaceBefore=14,
-            spaceAfter=8,
-            fontName='Helvetica-Bold',
-            borderWidth=0,
-            borderPadding=0,
-            borderColor=colors.HexColor('#2c5aa0'),
-            underlineWidth=2,
-        )
-        
-        job_title_style = ParagraphStyle(
-            'JobTitle',
-            parent=styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=2,
-            fontName='Helvetica-Bold'
-        )
-        
-        company_style = ParagraphStyle(
-            'Company',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#555555'),
-            spaceAfter=4,
-            fontName='Helvetica-Oblique'
-        )
-        
-        body_style = ParagraphStyle(
-            'Body',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=4,
-            fontName='Helvetica',
-            leading=14
-        )
-        
-        bullet_style = ParagraphStyle(
-            'Bullet',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=3,
-            leftIndent=20,
-            fontName='Helvetica',
-            leading=13
-        )
+        append = story.append
+        styles = _get_pdf_styles()
         
         # Header - Name
-        name = resume_data.get('name', resume_data.get('full_name', 'Your Name'))
-        story.append(Paragraph(f"<b>{name.upper()}</b>", name_style))
+        append(rl.Paragraph(f"<b>{resume_data['_name_upper']}</b>", styles['name']))
         
         # Contact Information
-        contact_parts = []
-        if resume_data.get('email'):
-            contact_parts.append(resume_data['email'])
-        if resume_data.get('phone'):
-            contact_parts.append(resume_data['phone'])
-        if resume_data.get('location'):
-            contact_parts.append(resume_data['location'])
+        contact_parts = resume_data['_contact']
         if resume_data.get('linkedin'):
-            contact_parts.append(resume_data['linkedin'])
+            contact_parts = contact_parts + [resume_data['linkedin']]
         
         if contact_parts:
             contact_text = " • ".join(contact_parts)
-            story.append(Paragraph(contact_text, contact_style))
+            append(rl.Paragraph(contact_text, styles['contact']))
         
         # Horizontal line
-        story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#2c5aa0'), spaceBefore=0, spaceAfter=12))
+        append(rl.HRFlowable(width="100%", thickness=1, color=rl.COLOR_ACCENT, spaceBefore=0, spaceAfter=12))
         
-        # Professional Summary
-        if resume_data.get('summary'):
-            story.append(Paragraph("<b>PROFESSIONAL SUMMARY</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            summary_text = resume_data['summary']
-            story.append(Paragraph(summary_text, body_style))
-            story.append(Spacer(1, 8))
-        
-        # Skills
-        if resume_data.get('skills'):
-            story.append(Paragraph("<b>SKILLS</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            
-            skills = self._parse_json_field(resume_data['skills'])
-            if isinstance(skills, list):
-                # Group skills into rows of 3
-                skill_text = " • ".join(skills)
-                story.append(Paragraph(skill_text, body_style))
-            else:
-                story.append(Paragraph(str(skills), body_style))
-            story.append(Spacer(1, 8))
-        
-        # Professional Experience
-        if resume_data.get('experience'):
-            story.append(Paragraph("<b>PROFESSIONAL EXPERIENCE</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            
-            experiences = self._parse_json_field(resume_data['experience'])
-            for exp in experiences:
-                if isinstance(exp, dict):
-                    # Job title and company
-                    title_text = exp.get('title', 'Position')
-                    story.append(Paragraph(f"<b>{title_text}</b>", job_title_style))
-                    
-                    # Company and dates
-                    company_info = exp.get('company', '')
-                    if not company_info and 'description' in exp and exp['description']:
-                        # Sometimes title contains company info
-                        company_info = title_text
-                    
-                    story.append(Paragraph(company_info, company_style))
-                    
-                    # Responsibilities/achievements
-                    descriptions = exp.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            # Add bullet point
-                            story.append(Paragraph(f"• {desc.strip()}", bullet_style))
-                    
-                    story.append(Spacer(1, 8))
-        
-        # Education
-        if resume_data.get('education'):
-            story.append(Paragraph("<b>EDUCATION</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            
-            educations = self._parse_json_field(resume_data['education'])
-            for edu in educations:
-                if isinstance(edu, dict):
-                    degree = edu.get('title', 'Degree')
-                    story.append(Paragraph(f"<b>{degree}</b>", job_title_style))
-                    
-                    descriptions = edu.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            story.append(Paragraph(desc.strip(), body_style))
-                    
-                    story.append(Spacer(1, 6))
-        
-        # Projects
-        if resume_data.get('projects'):
-            story.append(Paragraph("<b>PROJECTS</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            
-            projects = self._parse_json_field(resume_data['projects'])
-            for proj in projects:
-                if isinstance(proj, dict):
-                    proj_name = proj.get('title', 'Project')
-                    story.append(Paragraph(f"<b>{proj_name}</b>", job_title_style))
-                    
-                    descriptions = proj.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            story.append(Paragraph(f"• {desc.strip()}", bullet_style))
-                    
-                    story.append(Spacer(1, 6))
-        
-        # Certifications
-        if resume_data.get('certifications'):
-            story.append(Paragraph("<b>CERTIFICATIONS</b>", section_heading_style))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#2c5aa0'), spaceBefore=2, spaceAfter=6))
-            
-            certs = self._parse_json_field(resume_data['certifications'])
-            for cert in certs:
-                if isinstance(cert, dict):
-                    cert_name = cert.get('title', 'Certification')
-                    story.append(Paragraph(f"• {cert_name}", bullet_style))
-                elif isinstance(cert, str):
-                    story.append(Paragraph(f"• {cert}", bullet_style))
+        # Body sections, each with a ruled heading. The rule is stateless
+        # between draws, so one instance is shared by every heading in this
+        # document (not across documents: drawOn binds it to a canvas).
+        section_rule = rl.HRFlowable(width="100%", thickness=0.5, color=rl.COLOR_ACCENT, spaceBefore=2, spaceAfter=6)
+        for key, heading, render_pdf, _ in self._section_plan(resume_data):
+            append(rl.Paragraph(f"<b>{heading}</b>", styles['section_heading']))
+            append(section_rule)
+            render_pdf(self, story, resume_data[key], styles)
         
         # Build PDF
         doc.build(story)
@@ -256,278 +291,396 @@ class ProfessionalResumeGenerator:
     
     def generate_docx(self, resume_data: Dict, filename: Optional[str] = None) -> str:
         """Generate a professional DOCX resume."""
+        resume_data = self._normalize(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.docx"
+            filename = f"{default_basename()}.docx"
         
         filepath = self.output_dir / filename
+        dx = _docx_lib()
         
-        doc = Document()
-        
-        # Set document margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Cm(1.5)
-            section.bottom_margin = Cm(1.5)
-            section.left_margin = Cm(2)
-            section.right_margin = Cm(2)
+        # Start from the pre-built template; margins are already set
+        doc = dx.Document(io.BytesIO(dx.template))
         
         # Name - Large and bold
-        name = resume_data.get('name', resume_data.get('full_name', 'Your Name'))
-        name_para = doc.add_paragraph()
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_run = name_para.add_run(name.upper())
-        name_run.bold = True
-        name_run.font.size = Pt(20)
-        name_run.font.color.rgb = RGBColor(26, 26, 26)
+        doc.add_paragraph(resume_data['_name_upper'], style='RMName')
         
         # Contact information
-        contact_parts = []
-        if resume_data.get('email'):
-            contact_parts.append(resume_data['email'])
-        if resume_data.get('phone'):
-            contact_parts.append(resume_data['phone'])
-        if resume_data.get('location'):
-            contact_parts.append(resume_data['location'])
-        
-        if contact_parts:
-            contact_para = doc.add_paragraph(" • ".join(contact_parts))
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_para.runs[0].font.size = Pt(10)
-            contact_para.runs[0].font.color.rgb = RGBColor(85, 85, 85)
+        if resume_data['_contact']:
+            doc.add_paragraph(" • ".join(resume_data['_contact']), style='RMContact')
         
         doc.add_paragraph()  # Spacing
         
-        # Professional Summary
-        if resume_data.get('summary'):
-            self._add_section_heading(doc, 'PROFESSIONAL SUMMARY')
-            summary_para = doc.add_paragraph(resume_data['summary'])
-            summary_para.runs[0].font.size = Pt(10)
-            doc.add_paragraph()  # Spacing
+        # Body sections, each with a bordered heading
+        for key, heading, _, render_docx in self._section_plan(resume_data):
+            self._add_section_heading(doc, heading)
+            render_docx(self, doc, resume_data[key])
         
-        # Skills
-        if resume_data.get('skills'):
-            self._add_section_heading(doc, 'SKILLS')
-            skills = self._parse_json_field(resume_data['skills'])
-            if isinstance(skills, list):
-                skills_text = " • ".join(skills)
-                skills_para = doc.add_paragraph(skills_text)
-                skills_para.runs[0].font.size = Pt(10)
-            doc.add_paragraph()  # Spacing
-        
-        # Professional Experience
-        if resume_data.get('experience'):
-            self._add_section_heading(doc, 'PROFESSIONAL EXPERIENCE')
-            experiences = self._parse_json_field(resume_data['experience'])
-            
-            for exp in experiences:
-                if isinstance(exp, dict):
-                    # Job title
-                    title_para = doc.add_paragraph()
-                    title_run = title_para.add_run(exp.get('title', 'Position'))
-                    title_run.bold = True
-                    title_run.font.size = Pt(11)
-                    
-                    # Company
-                    company_para = doc.add_paragraph(exp.get('company', ''))
-                    company_para.runs[0].italic = True
-                    company_para.runs[0].font.size = Pt(10)
-                    company_para.runs[0].font.color.rgb = RGBColor(85, 85, 85)
-                    
-                    # Descriptions
-                    descriptions = exp.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            bullet_para = doc.add_paragraph(desc.strip(), style='List Bullet')
-                            bullet_para.runs[0].font.size = Pt(10)
-                    
-                    doc.add_paragraph()  # Spacing between jobs
+        # Save document
+        doc.save(str(filepath))
+        return str(filepath)
+    
+    def _pdf_summary(self, story, summary, styles):
+        """Render the professional summary section for the PDF."""
+        rl = _pdf_lib()
+        story.append(rl.Paragraph(summary, styles['body']))
+        story.append(rl.Spacer(1, 8))
+    
+    def _pdf_skills(self, story, skills, styles):
+        """Render the skills section for the PDF."""
+        rl = _pdf_lib()
+        if isinstance(skills, list):
+            skill_text = " • ".join(skills)
+            story.append(rl.Paragraph(skill_text, styles['body']))
+        else:
+            story.append(rl.Paragraph(str(skills), styles['body']))
+        story.append(rl.Spacer(1, 8))
+    
+    def _pdf_experience(self, story, experiences, styles):
+        """Render the professional experience section for the PDF."""
+        rl = _pdf_lib()
+        append = story.append
+        bullet_style = styles['bullet']
+        for exp in experiences:
+            if isinstance(exp, dict):
+                # Job title and company
+                title_text = exp.get('title', 'Position')
+                append(rl.Paragraph(f"<b>{title_text}</b>", styles['job_title']))
+                
+                # Company and dates
+                company_info = exp.get('company', '')
+                if not company_info and 'description' in exp and exp['description']:
+                    # Sometimes title contains company info
+                    company_info = title_text
+                
+                append(rl.Paragraph(company_info, styles['company']))
+                
+                # Responsibilities/achievements
+                story.extend(
+                    rl.Paragraph(f"• {desc}", bullet_style)
+                    for desc in exp['_bullets']
+                )
+                
+                append(rl.Spacer(1, 8))
+    
+    def _pdf_education(self, story, educations, styles):
+        """Render the education section for the PDF."""
+        rl = _pdf_lib()
+        append = story.append
+        body_style = styles['body']
+        for edu in educations:
+            if isinstance(edu, dict):
+                degree = edu.get('title', 'Degree')
+                append(rl.Paragraph(f"<b>{degree}</b>", styles['job_title']))
+                
+                story.extend(
+                    rl.Paragraph(desc, body_style)
+                    for desc in edu['_bullets']
+                )
+                
+                append(rl.Spacer(1, 6))
+    
+    def _pdf_projects(self, story, projects, styles):
+        """Render the projects section for the PDF."""
+        rl = _pdf_lib()
+        append = story.append
+        bullet_style = styles['bullet']
+        for proj in projects:
+            if isinstance(proj, dict):
+                proj_name = proj.get('title', 'Project')
+                append(rl.Paragraph(f"<b>{proj_name}</b>", styles['job_title']))
+                
+                story.extend(
+                    rl.Paragraph(f"• {desc}", bullet_style)
+                    for desc in proj['_bullets']
+                )
+                
+                append(rl.Spacer(1, 6))
+    
+    def _pdf_certifications(self, story, certs, styles):
+        """Render the certifications section for the PDF."""
+        rl = _pdf_lib()
+        append = story.append
+        bullet_style = styles['bullet']
+        for cert in certs:
+            if isinstance(cert, dict):
+                cert_name = cert.get('title', 'Certification')
+                append(rl.Paragraph(f"• {cert_name}", bullet_style))
+            elif isinstance(cert, str):
+                append(rl.Paragraph(f"• {cert}", bullet_style))
+    
+    def _docx_summary(self, doc, summary):
+        """Render the professional summary section for the DOCX."""
+        doc.add_paragraph(summary, style='RMBody')
+        doc.add_paragraph()  # Spacing
+    
+    def _docx_skills(self, doc, skills):
+        """Render the skills section for the DOCX."""
+        if isinstance(skills, list):
+            doc.add_paragraph(" • ".join(skills), style='RMBody')
+        doc.add_paragraph()  # Spacing
+    
+    def _docx_experience(self, doc, experiences):
+        """Render the professional experience section for the DOCX."""
+        add_paragraph = doc.add_paragraph
+        for exp in experiences:
+            if isinstance(exp, dict):
+                # Job title
+                add_paragraph(exp.get('title', 'Position'), style='RMJobTitle')
+                
+                # Company
+                add_paragraph(exp.get('company', ''), style='RMCompany')
+                
+                # Descriptions
+                for desc in exp['_bullets']:
+                    add_paragraph(desc, style='RMBullet')
+                
+                add_paragraph()  # Spacing between jobs
+    
+    def _docx_education(self, doc, educations):
+        """Render the education section for the DOCX."""
+        add_paragraph = doc.add_paragraph
+        for edu in educations:
+            if isinstance(edu, dict):
+                add_paragraph(edu.get('title', 'Degree'), style='RMJobTitle')
+                
+                for desc in edu['_bullets']:
+                    add_paragraph(desc, style='RMBody')
+    
+    def _docx_projects(self, doc, projects):
+        """Render the projects section for the DOCX."""
+        add_paragraph = doc.add_paragraph
+        for proj in projects:
+            if isinstance(proj, dict):
+                add_paragraph(proj.get('title', 'Project'), style='RMJobTitle')
+                
+                for desc in proj['_bullets']:
+                    add_paragraph(desc, style='RMBullet')
+    
+    def _docx_certifications(self, doc, certs):
+        """Render the certifications section for the DOCX."""
+        for cert in certs:
+            if isinstance(cert, dict):
+                doc.add_paragraph(cert.get('title', 'Certification'), style='RMBullet')
+            elif isinstance(cert, str):
+                doc.add_paragraph(cert, style='RMBullet')
+    
+    # Section layout shared by the PDF and DOCX builders, in document order:
+    # (resume key, heading, PDF renderer, DOCX renderer)
+    _SECTIONS = (
+        ('summary', 'PROFESSIONAL SUMMARY', _pdf_summary, _docx_summary),
+        ('skills', 'SKILLS', _pdf_skills, _docx_skills),
+        ('experience', 'PROFESSIONAL EXPERIENCE', _pdf_experience, _docx_experience),
+        ('education', 'EDUCATION', _pdf_education, _docx_education),
+        ('projects', 'PROJECTS', _pdf_projects, _docx_projects),
+        ('certifications', 'CERTIFICATIONS', _pdf_certifications, _docx_certifications),
+    )
+    
+    @classmethod
+    def _section_plan(cls, resume_data: Dict) -> tuple:
+        """
+        Return the _SECTIONS entries to render for resume_data, in order.
+        
+        Most resumes share one of a handful of shapes, so the filtered plan
+        is built once per shape and the builders loop over it without
+        re-checking every section.
+        """
+        shape = tuple(bool(resume_data.get(section[0])) for section in cls._SECTIONS)
+        plan = _SECTION_PLANS.get(shape)
+        if plan is None:
+            plan = _SECTION_PLANS[shape] = tuple(
+                section for section, present in zip(cls._SECTIONS, shape) if present
+            )
+        return plan
+    
+    def generate_all(self, resume_data: Dict, basename: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate PDF, DOCX and TXT versions of a resume concurrently.
         
-        # Education
-        if resume_data.get('education'):
-            self._add_section_heading(doc, 'EDUCATION')
-            educations = self._parse_json_field(resume_data['education'])
+        The JSON fields are parsed once and shared read-only by all three
+        builders, which run on a format_executor pool.
+        
+        Args:
+            resume_data: Dictionary containing resume content
+            basename: Optional file stem shared by all three files
             
-            for edu in educations:
-                if isinstance(edu, dict):
-                    degree_para = doc.add_paragraph()
-                    degree_run = degree_para.add_run(edu.get('title', 'Degree'))
-                    degree_run.bold = True
-                    degree_run.font.size = Pt(11)
-                    
-                    descriptions = edu.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            desc_para = doc.add_paragraph(desc.strip())
-                            desc_para.runs[0].font.size = Pt(10)
-        
-        # Projects
-        if resume_data.get('projects'):
-            self._add_section_heading(doc, 'PROJECTS')
-            projects = self._parse_json_field(resume_data['projects'])
+        Returns:
+            Dictionary mapping format ('pdf', 'docx', 'txt') to file path
+        """
+        basename = basename or default_basename()
+        with format_executor(3) as executor:
+            futures = self._submit_formats(executor, self._normalize(resume_data), basename)
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    def generate_many(
+        self,
+        resumes: List[Dict],
+        basenames: Optional[List[str]] = None,
+        max_workers: int = 4
+    ) -> List[Dict[str, str]]:
+        """
+        Generate PDF, DOCX and TXT versions of many resumes in bulk.
+        
+        All documents are rendered on one shared thread pool instead of
+        spinning up a pool per resume.
+        
+        Args:
+            resumes: List of resume content dictionaries
+            basenames: Optional file stems, one per resume
+            max_workers: Number of worker threads
             
-            for proj in projects:
-                if isinstance(proj, dict):
-                    proj_para = doc.add_paragraph()
-                    proj_run = proj_para.add_run(proj.get('title', 'Project'))
-                    proj_run.bold = True
-                    proj_run.font.size = Pt(11)
-                    
-                    descriptions = proj.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
-                    
-                    for desc in descriptions:
-                        if desc.strip():
-                            bullet_para = doc.add_paragraph(desc.strip(), style='List Bullet')
-                            bullet_para.runs[0].font.size = Pt(10)
-        
-        # Certifications
-        if resume_data.get('certifications'):
-            self._add_section_heading(doc, 'CERTIFICATIONS')
-            certs = self._parse_json_field(resume_data['certifications'])
+        Returns:
+            List of format-to-path dictionaries, in input order
             
-            for cert in certs:
-                if isinstance(cert, dict):
-                    cert_para = doc.add_paragraph(cert.get('title', 'Certification'), style='List Bullet')
-                    cert_para.runs[0].font.size = Pt(10)
-                elif isinstance(cert, str):
-                    cert_para = doc.add_paragraph(cert, style='List Bullet')
-                    cert_para.runs[0].font.size = Pt(10)
-        
-        # Save document
-        doc.save(str(filepath))
-        return str(filepath)
+        Raises:
+            ValueError: If basenames and resumes differ in length
+        """
+        if basenames is None:
+            stem = default_basename()
+            basenames = [f"{stem}_{i}" for i in range(len(resumes))]
+        elif len(basenames) != len(resumes):
+            raise ValueError(
+                f"Got {len(basenames)} basenames for {len(resumes)} resumes"
+            )
+        
+        with format_executor(max_workers) as executor:
+            batches = [
+                self._submit_formats(executor, self._normalize(resume_data), basename)
+                for resume_data, basename in zip(resumes, basenames)
+            ]
+            return [
+                {fmt: future.result() for fmt, future in futures.items()}
+                for futures in batches
+            ]
+    
+    def _submit_formats(self, executor, data: Dict, basename: str) -> Dict:
+        """Queue one build per output format and return the futures by format."""
+        generators = {
+            'pdf': self.generate_pdf,
+            'docx': self.generate_docx,
+            'txt': self.generate_txt,
+        }
+        return {
+            fmt: executor.submit(generate, data, f"{basename}.{fmt}")
+            for fmt, generate in generators.items()
+        }
     
     def _add_section_heading(self, doc, heading_text):
         """Add a formatted section heading to the document."""
-        heading_para = doc.add_paragraph()
-        heading_run = heading_para.add_run(heading_text)
-        heading_run.bold = True
-        heading_run.font.size = Pt(12)
-        heading_run.font.color.rgb = RGBColor(44, 90, 160)  # Professional blue
+        dx = _docx_lib()
+        heading_para = doc.add_paragraph(heading_text, style='RMSectionHeading')
         
         # Add a bottom border
-        p_pr = heading_para._element.get_or_add_pPr()
-        p_bdr = OxmlElement('w:pBdr')
-        bottom = OxmlElement('w:bottom')
-        bottom.set(qn('w:val'), 'single')
-        bottom.set(qn('w:sz'), '6')
-        bottom.set(qn('w:space'), '1')
-        bottom.set(qn('w:color'), '2c5aa0')
-        p_bdr.append(bottom)
-        p_pr.append(p_bdr)
+        heading_para._element.get_or_add_pPr().append(deepcopy(dx.section_border))
+    
+    @staticmethod
+    def _iter_bullets(value) -> List[str]:
+        """Return a description field as a list of stripped, non-empty lines."""
+        if isinstance(value, str):
+            value = [value]
+        return [text for desc in value if desc and (text := desc.strip())]
+    
+    def _normalize(self, resume_data: Dict) -> Dict:
+        """
+        Return a copy of resume_data prepared for the builders.
+        
+        JSON fields are parsed, and the values every format needs are computed
+        once under underscore keys: '_name', '_name_upper', '_contact' and a
+        '_bullets' list on each description-bearing entry. Data that is
+        already normalized (e.g. shared by generate_all) is returned as is.
+        """
+        if '_name' in resume_data:
+            return resume_data
+        
+        normalized = dict(resume_data)
+        for key in _JSON_FIELDS:
+            if normalized.get(key):
+                normalized[key] = self._parse_json_field(normalized[key])
+        
+        name = normalized.get('name', normalized.get('full_name', 'Your Name'))
+        normalized['_name'] = name
+        normalized['_name_upper'] = name.upper()
+        normalized['_contact'] = [normalized[key] for key in _CONTACT_FIELDS if normalized.get(key)]
+        
+        # Entries are copied so the caller's dicts are never modified
+        for key in _BULLET_SECTIONS:
+            entries = normalized.get(key)
+            if entries and isinstance(entries, list):
+                normalized[key] = [
+                    {**entry, '_bullets': self._iter_bullets(entry.get('description', []))}
+                    if isinstance(entry, dict) else entry
+                    for entry in entries
+                ]
+        return normalized
     
     def _parse_json_field(self, field):
         """Parse a field that might be JSON string or already parsed."""
         if isinstance(field, str):
             try:
-                return json.loads(field)
-            except:
+                return _json_loads(field)
+            except ValueError:  # also covers orjson.JSONDecodeError
                 return field
         return field
     
     def generate_txt(self, resume_data: Dict, filename: Optional[str] = None) -> str:
         """Generate a plain text resume (ATS-friendly)."""
+        resume_data = self._normalize(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.txt"
+            filename = f"{default_basename()}.txt"
         
         filepath = self.output_dir / filename
         
-        lines = []
+        # Each block ends with a newline; the trailing one is dropped on write
+        parts = []
         
         # Name
-        name = resume_data.get('name', resume_data.get('full_name', 'Your Name'))
-        lines.append(name.upper())
-        lines.append("=" * len(name))
-        lines.append("")
+        parts.append(f"{resume_data['_name_upper']}\n{'=' * len(resume_data['_name'])}\n\n")
         
         # Contact
-        contact_parts = []
         if resume_data.get('email'):
-            contact_parts.append(f"Email: {resume_data['email']}")
+            parts.append(f"Email: {resume_data['email']}\n")
         if resume_data.get('phone'):
-            contact_parts.append(f"Phone: {resume_data['phone']}")
+            parts.append(f"Phone: {resume_data['phone']}\n")
         if resume_data.get('location'):
-            contact_parts.append(f"Location: {resume_data['location']}")
-        
-        lines.extend(contact_parts)
-        lines.append("")
-        lines.append("")
+            parts.append(f"Location: {resume_data['location']}\n")
+        parts.append("\n\n")
         
         # Summary
         if resume_data.get('summary'):
-            lines.append("PROFESSIONAL SUMMARY")
-            lines.append("-" * 40)
-            lines.append(resume_data['summary'])
-            lines.append("")
-            lines.append("")
+            parts.append(f"PROFESSIONAL SUMMARY\n{_TXT_RULE}\n{resume_data['summary']}\n\n\n")
         
         # Skills
         if resume_data.get('skills'):
-            lines.append("SKILLS")
-            lines.append("-" * 40)
-            skills = self._parse_json_field(resume_data['skills'])
-            if isinstance(skills, list):
-                lines.append(", ".join(skills))
-            else:
-                lines.append(str(skills))
-            lines.append("")
-            lines.append("")
+            skills = resume_data['skills']
+            skills_text = ", ".join(skills) if isinstance(skills, list) else str(skills)
+            parts.append(f"SKILLS\n{_TXT_RULE}\n{skills_text}\n\n\n")
         
         # Experience
         if resume_data.get('experience'):
-            lines.append("PROFESSIONAL EXPERIENCE")
-            lines.append("-" * 40)
-            experiences = self._parse_json_field(resume_data['experience'])
+            parts.append(f"PROFESSIONAL EXPERIENCE\n{_TXT_RULE}\n")
             
-            for exp in experiences:
+            for exp in resume_data['experience']:
                 if isinstance(exp, dict):
-                    lines.append(exp.get('title', 'Position'))
-                    lines.append(exp.get('company', ''))
-                    lines.append("")
+                    parts.append(f"{exp.get('title', 'Position')}\n{exp.get('company', '')}\n\n")
                     
-                    descriptions = exp.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
+                    parts.extend([f"  • {desc}\n" for desc in exp['_bullets']])
                     
-                    for desc in descriptions:
-                        if desc.strip():
-                            lines.append(f"  • {desc.strip()}")
-                    
-                    lines.append("")
-            lines.append("")
+                    parts.append("\n")
+            parts.append("\n")
         
         # Education
         if resume_data.get('education'):
-            lines.append("EDUCATION")
-            lines.append("-" * 40)
-            educations = self._parse_json_field(resume_data['education'])
+            parts.append(f"EDUCATION\n{_TXT_RULE}\n")
             
-            for edu in educations:
+            for edu in resume_data['education']:
                 if isinstance(edu, dict):
-                    lines.append(edu.get('title', 'Degree'))
-                    
-                    descriptions = edu.get('description', [])
-                    if isinstance(descriptions, str):
-                        descriptions = [descriptions]
+                    parts.append(f"{edu.get('title', 'Degree')}\n")
                     
-                    for desc in descriptions:
-                        if desc.strip():
-                            lines.append(f"  {desc.strip()}")
+                    parts.extend([f"  {desc}\n" for desc in edu['_bullets']])
                     
-                    lines.append("")
+                    parts.append("\n")
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        filepath.write_bytes("".join(parts)[:-1].encode('utf-8'))
         
         return str(filepath)
 
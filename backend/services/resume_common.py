@@ -0,0 +1,67 @@
+"""Helpers shared by the resume generators."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable
+
+# reportlab and python-docx cost a few hundred milliseconds to import, so they
+# are loaded on first use; callers that only need TXT output never pay for them
+_LAZY = {}
+
+
+def load_once(key: str, build: Callable[[], Any]) -> Any:
+    """
+    Return the value cached under key, building it on first use.
+    
+    The value is only published once fully built, so a thread racing the
+    first load never sees a partial one; if two threads build it at once,
+    both get whichever copy was stored first.
+    """
+    value = _LAZY.get(key)
+    if value is None:
+        value = _LAZY.setdefault(key, build())
+    return value
+
+
+def pdf_lib() -> SimpleNamespace:
+    """Import reportlab on first use and return the names the PDF builders need."""
+    return load_once('pdf', _import_reportlab)
+
+
+def _import_reportlab() -> SimpleNamespace:
+    """Import the reportlab names used by the resume generators."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
+    
+    return SimpleNamespace(
+        colors=colors,
+        TA_CENTER=TA_CENTER,
+        letter=letter,
+        getSampleStyleSheet=getSampleStyleSheet,
+        ParagraphStyle=ParagraphStyle,
+        inch=inch,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        HRFlowable=HRFlowable,
+    )
+
+
+def format_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Thread pool for building several output formats at once.
+    
+    reportlab and python-docx spend much of their time in C code and file
+    I/O, so builds of different formats overlap well on threads.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def default_basename() -> str:
+    """File stem for generated resumes when the caller does not name one."""
+    # time_ns avoids strftime's locale work and same-second collisions
+    return f"resume_{time.time_ns()}"
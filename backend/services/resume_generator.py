@@ -1,16 +1,128 @@
 """Resume generation service for creating formatted resume documents."""
+import io
 import json
-from typing import Dict, Optional
+import re
+import zipfile
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Optional, Sequence
 from pathlib import Path
-from datetime import datetime
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from xml.sax.saxutils import escape
+from backend.services.resume_common import default_basename, format_executor, load_once, pdf_lib
+
+try:
+    # C parser, several times faster than json on resume field blobs
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _docx_template() -> SimpleNamespace:
+    """
+    Build the DOCX package skeleton once with python-docx.
+    
+    Returns the archive members in order, plus the main document XML split
+    around its body, so each resume only has to supply its paragraphs.
+    """
+    return load_once('resume_docx', _build_docx_template)
+
+
+def _build_docx_template() -> SimpleNamespace:
+    """Save a blank resume document and split it into reusable pieces."""
+    from docx import Document
+    from docx.shared import Inches
+    
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = Inches(0.5)
+        section.bottom_margin = Inches(0.5)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+    
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        parts = [(info.filename, archive.read(info)) for info in archive.infolist()]
+    
+    document_xml = dict(parts)[_DOCX_DOCUMENT_PART].decode('utf-8')
+    body_start = document_xml.index('<w:body>') + len('<w:body>')
+    body_end = document_xml.index('<w:sectPr')
+    return SimpleNamespace(
+        parts=parts,
+        head=document_xml[:body_start],
+        tail=document_xml[body_end:],
+    )
+
+
+# DOCX body markup is written directly, matching what python-docx emits
+_DOCX_DOCUMENT_PART = 'word/document.xml'
+_DOCX_BOLD = '<w:b/>'
+_DOCX_NAME_COLOR = '<w:color w:val="000080"/>'
+
+# Characters python-docx stores as run elements rather than text
+_DOCX_RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+
+# Control characters XML 1.0 cannot carry; lxml rejects them the same way
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _docx_run(text: str, props: str = '') -> str:
+    """Serialize one run, mapping tabs and line breaks as python-docx does."""
+    content = []
+    for piece in _DOCX_RUN_BREAK_RE.split(text):
+        if piece == '\t':
+            content.append('<w:tab/>')
+        elif piece == '\r' or piece == '\n':
+            content.append('<w:br/>')
+        elif piece:
+            if _XML_INVALID_RE.search(piece):
+                raise ValueError(
+                    "All strings must be XML compatible: Unicode or ASCII, "
+                    "no NULL bytes or control characters"
+                )
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            content.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    
+    run_props = f'<w:rPr>{props}</w:rPr>' if props else ''
+    return f'<w:r>{run_props}{"".join(content)}</w:r>'
+
+
+def _docx_paragraph(
+    text: Optional[str] = None,
+    style: Optional[str] = None,
+    center: bool = False,
+    run_props: str = ''
+) -> str:
+    """
+    Serialize one paragraph the way python-docx's add_paragraph writes it.
+    
+    A run is only written for non-empty text or when it carries formatting.
+    """
+    para_props = ''
+    if style or center:
+        style_xml = f'<w:pStyle w:val="{style}"/>' if style else ''
+        align_xml = '<w:jc w:val="center"/>' if center else ''
+        para_props = f'<w:pPr>{style_xml}{align_xml}</w:pPr>'
+    
+    run = _docx_run(text or '', run_props) if text or run_props else ''
+    if not para_props and not run:
+        return '<w:p/>'
+    return f'<w:p>{para_props}{run}</w:p>'
+
+
+# PDF heading colour. reportlab reads any 3-tuple as RGB, so this is exactly
+# what the python-docx RGBColor used here previously produced
+_PDF_HEADING_COLOR = (0, 0, 128)
+
+# Resume fields that may arrive as JSON strings from the database
+_JSON_FIELDS = ('experience', 'education', 'skills', 'projects')
+
+# Sections holding lists of {'title', 'description'} entries
+_ENTRY_FIELDS = ('experience', 'education', 'projects')
+
+# Contact fields in display order, with their plain-text labels
+_CONTACT_FIELDS = (('email', 'Email'), ('phone', 'Phone'), ('location', 'Location'))
 
 
 class ResumeGenerator:
@@ -32,43 +144,111 @@ class ResumeGenerator:
         Returns:
             Path to generated PDF file
         """
+        resume_data = self._parse_resume_cached(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.pdf"
+            filename = f"{default_basename()}.pdf"
         
         filepath = self.output_dir / filename
+        rl = pdf_lib()
         
         # Create PDF document
-        doc = SimpleDocTemplate(
+        doc = rl.SimpleDocTemplate(
             str(filepath),
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            pagesize=rl.letter,
+            rightMargin=0.75*rl.inch,
+            leftMargin=0.75*rl.inch,
+            topMargin=0.75*rl.inch,
+            bottomMargin=0.75*rl.inch
         )
         
         # Container for PDF elements
         story = []
         
         # Define styles
-        styles = getSampleStyleSheet()
+        styles = self._styles()
+        title_style = styles['title']
+        heading_style = styles['heading']
+        body_style = styles['body']
+        
+        # Add name/title
+        if 'name' in resume_data or 'title' in resume_data:
+            name = resume_data.get('name', 'Your Name')
+            story.append(rl.Paragraph(name, title_style))
+            story.append(rl.Spacer(1, 12))
+        
+        # Add contact info
+        if 'email' in resume_data or 'phone' in resume_data:
+            contact_text = " | ".join(value for _, value in resume_data['_contact'])
+            story.append(rl.Paragraph(contact_text, body_style))
+            story.append(rl.Spacer(1, 12))
+        
+        # Body sections, laid out by the class-level _PDF_SECTIONS table
+        for key, heading, render in self._PDF_SECTIONS:
+            value = resume_data.get(key)
+            if value:
+                story.append(rl.Paragraph(heading, heading_style))
+                render(self, story, value, body_style)
+                story.append(rl.Spacer(1, 12))
+        
+        # Build PDF
+        doc.build(story)
+        
+        return str(filepath)
+    
+    def _pdf_summary(self, story, summary, body_style):
+        """Render the professional summary section for the PDF."""
+        story.append(pdf_lib().Paragraph(summary, body_style))
+    
+    def _pdf_skills(self, story, skills, body_style):
+        """Render the skills section for the PDF."""
+        if isinstance(skills, list):
+            story.append(pdf_lib().Paragraph(" • ".join(skills), body_style))
+    
+    def _pdf_entries(self, story, entries, body_style, bullet=""):
+        """Render titled entries, each followed by its description lines."""
+        Paragraph = pdf_lib().Paragraph
+        for entry in entries:
+            title = entry.get('title', '')
+            story.append(Paragraph(f"<b>{title}</b>", body_style))
+            for desc in entry.get('description', []):
+                story.append(Paragraph(f"{bullet}{desc}", body_style))
+    
+    def _pdf_bulleted_entries(self, story, entries, body_style):
+        """Render titled entries with bulleted description lines."""
+        self._pdf_entries(story, entries, body_style, bullet="• ")
+    
+    # PDF body layout in document order: (resume key, heading, renderer).
+    # Built once with the class; generate_pdf only walks it.
+    _PDF_SECTIONS = (
+        ('summary', 'PROFESSIONAL SUMMARY', _pdf_summary),
+        ('experience', 'WORK EXPERIENCE', _pdf_bulleted_entries),
+        ('education', 'EDUCATION', _pdf_entries),
+        ('skills', 'SKILLS', _pdf_skills),
+        ('projects', 'PROJECTS', _pdf_bulleted_entries),
+    )
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _styles(cls) -> Dict:
+        """Build the PDF paragraph styles once; they never depend on resume data."""
+        rl = pdf_lib()
+        ParagraphStyle = rl.ParagraphStyle
+        styles = rl.getSampleStyleSheet()
         
-        # Custom styles
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=24,
-            textColor=RGBColor(0, 0, 128),
+            textColor=_PDF_HEADING_COLOR,
             spaceAfter=12,
-            alignment=TA_CENTER
+            alignment=rl.TA_CENTER
         )
         
         heading_style = ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
-            textColor=RGBColor(0, 0, 128),
+            textColor=_PDF_HEADING_COLOR,
             spaceAfter=6,
             spaceBefore=12
         )
@@ -80,81 +260,7 @@ class ResumeGenerator:
             spaceAfter=6
         )
         
-        # Add name/title
-        if 'name' in resume_data or 'title' in resume_data:
-            name = resume_data.get('name', 'Your Name')
-            story.append(Paragraph(name, title_style))
-            story.append(Spacer(1, 12))
-        
-        # Add contact info
-        if 'email' in resume_data or 'phone' in resume_data:
-            contact = []
-            if resume_data.get('email'):
-                contact.append(resume_data['email'])
-            if resume_data.get('phone'):
-                contact.append(resume_data['phone'])
-            if resume_data.get('location'):
-                contact.append(resume_data['location'])
-            
-            contact_text = " | ".join(contact)
-            story.append(Paragraph(contact_text, body_style))
-            story.append(Spacer(1, 12))
-        
-        # Add summary
-        if resume_data.get('summary'):
-            story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-            story.append(Paragraph(resume_data['summary'], body_style))
-            story.append(Spacer(1, 12))
-        
-        # Add experience
-        if resume_data.get('experience'):
-            story.append(Paragraph("WORK EXPERIENCE", heading_style))
-            experiences = self._parse_json_field(resume_data['experience'])
-            for exp in experiences:
-                if isinstance(exp, dict):
-                    title = exp.get('title', '')
-                    story.append(Paragraph(f"<b>{title}</b>", body_style))
-                    for desc in exp.get('description', []):
-                        story.append(Paragraph(f"• {desc}", body_style))
-            story.append(Spacer(1, 12))
-        
-        # Add education
-        if resume_data.get('education'):
-            story.append(Paragraph("EDUCATION", heading_style))
-            educations = self._parse_json_field(resume_data['education'])
-            for edu in educations:
-                if isinstance(edu, dict):
-                    title = edu.get('title', '')
-                    story.append(Paragraph(f"<b>{title}</b>", body_style))
-                    for desc in edu.get('description', []):
-                        story.append(Paragraph(desc, body_style))
-            story.append(Spacer(1, 12))
-        
-        # Add skills
-        if resume_data.get('skills'):
-            story.append(Paragraph("SKILLS", heading_style))
-            skills = self._parse_json_field(resume_data['skills'])
-            if isinstance(skills, list):
-                skills_text = " • ".join(skills)
-                story.append(Paragraph(skills_text, body_style))
-            story.append(Spacer(1, 12))
-        
-        # Add projects
-        if resume_data.get('projects'):
-            story.append(Paragraph("PROJECTS", heading_style))
-            projects = self._parse_json_field(resume_data['projects'])
-            for proj in projects:
-                if isinstance(proj, dict):
-                    title = proj.get('title', '')
-                    story.append(Paragraph(f"<b>{title}</b>", body_style))
-                    for desc in proj.get('description', []):
-                        story.append(Paragraph(f"• {desc}", body_style))
-            story.append(Spacer(1, 12))
-        
-        # Build PDF
-        doc.build(story)
-        
-        return str(filepath)
+        return {'title': title_style, 'heading': heading_style, 'body': body_style}
     
     def generate_docx(self, resume_data: Dict, filename: Optional[str] = None) -> str:
         """
@@ -167,107 +273,79 @@ class ResumeGenerator:
         Returns:
             Path to generated DOCX file
         """
+        resume_data = self._parse_resume_cached(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.docx"
+            filename = f"{default_basename()}.docx"
         
         filepath = self.output_dir / filename
         
-        # Create document
-        doc = Document()
-        
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.5)
-            section.bottom_margin = Inches(0.5)
-            section.left_margin = Inches(0.75)
-            section.right_margin = Inches(0.75)
+        # Body paragraphs as WordprocessingML, in document order
+        body = []
+        add = body.append
         
         # Add name/title
         if 'name' in resume_data or 'title' in resume_data:
             name = resume_data.get('name', 'Your Name')
-            heading = doc.add_heading(name, level=1)
-            heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            run = heading.runs[0]
-            run.font.color.rgb = RGBColor(0, 0, 128)
+            add(_docx_paragraph(name, style='Heading1', center=True, run_props=_DOCX_NAME_COLOR))
         
         # Add contact info
         if 'email' in resume_data or 'phone' in resume_data:
-            contact = []
-            if resume_data.get('email'):
-                contact.append(resume_data['email'])
-            if resume_data.get('phone'):
-                contact.append(resume_data['phone'])
-            if resume_data.get('location'):
-                contact.append(resume_data['location'])
-            
-            contact_para = doc.add_paragraph(" | ".join(contact))
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            contact_text = " | ".join(value for _, value in resume_data['_contact'])
+            add(_docx_paragraph(contact_text, center=True))
         
-        doc.add_paragraph()  # Spacing
+        add(_docx_paragraph())  # Spacing
         
         # Add summary
         if resume_data.get('summary'):
-            doc.add_heading('PROFESSIONAL SUMMARY', level=2)
-            doc.add_paragraph(resume_data['summary'])
+            add(_docx_paragraph('PROFESSIONAL SUMMARY', style='Heading2'))
+            add(_docx_paragraph(resume_data['summary']))
         
         # Add experience
         if resume_data.get('experience'):
-            doc.add_heading('WORK EXPERIENCE', level=2)
-            experiences = self._parse_json_field(resume_data['experience'])
-            for exp in experiences:
-                if isinstance(exp, dict):
-                    title = exp.get('title', '')
-                    p = doc.add_paragraph()
-                    run = p.add_run(title)
-                    run.bold = True
-                    
-                    for desc in exp.get('description', []):
-                        doc.add_paragraph(desc, style='List Bullet')
+            add(_docx_paragraph('WORK EXPERIENCE', style='Heading2'))
+            for exp in resume_data['experience']:
+                add(_docx_paragraph(exp.get('title', ''), run_props=_DOCX_BOLD))
+                for desc in exp.get('description', []):
+                    add(_docx_paragraph(desc, style='ListBullet'))
         
         # Add education
         if resume_data.get('education'):
-            doc.add_heading('EDUCATION', level=2)
-            educations = self._parse_json_field(resume_data['education'])
-            for edu in educations:
-                if isinstance(edu, dict):
-                    title = edu.get('title', '')
-                    p = doc.add_paragraph()
-                    run = p.add_run(title)
-                    run.bold = True
-                    
-                    for desc in edu.get('description', []):
-                        doc.add_paragraph(desc)
+            add(_docx_paragraph('EDUCATION', style='Heading2'))
+            for edu in resume_data['education']:
+                add(_docx_paragraph(edu.get('title', ''), run_props=_DOCX_BOLD))
+                for desc in edu.get('description', []):
+                    add(_docx_paragraph(desc))
         
         # Add skills
         if resume_data.get('skills'):
-            doc.add_heading('SKILLS', level=2)
-            skills = self._parse_json_field(resume_data['skills'])
+            add(_docx_paragraph('SKILLS', style='Heading2'))
+            skills = resume_data['skills']
             if isinstance(skills, list):
-                doc.add_paragraph(" • ".join(skills))
+                add(_docx_paragraph(" • ".join(skills)))
             else:
-                doc.add_paragraph(str(skills))
+                add(_docx_paragraph(str(skills)))
         
         # Add projects
         if resume_data.get('projects'):
-            doc.add_heading('PROJECTS', level=2)
-            projects = self._parse_json_field(resume_data['projects'])
-            for proj in projects:
-                if isinstance(proj, dict):
-                    title = proj.get('title', '')
-                    p = doc.add_paragraph()
-                    run = p.add_run(title)
-                    run.bold = True
-                    
-                    for desc in proj.get('description', []):
-                        doc.add_paragraph(desc, style='List Bullet')
+            add(_docx_paragraph('PROJECTS', style='Heading2'))
+            for proj in resume_data['projects']:
+                add(_docx_paragraph(proj.get('title', ''), run_props=_DOCX_BOLD))
+                for desc in proj.get('description', []):
+                    add(_docx_paragraph(desc, style='ListBullet'))
         
         # Save document
-        doc.save(str(filepath))
+        self._write_docx(filepath, "".join(body))
         
         return str(filepath)
     
+    def _write_docx(self, filepath: Path, body_xml: str):
+        """Write a .docx package: the cached template parts around body_xml."""
+        template = _docx_template()
+        document_xml = (template.head + body_xml + template.tail).encode('utf-8')
+        with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name, data in template.parts:
+                archive.writestr(name, document_xml if name == _DOCX_DOCUMENT_PART else data)
+    
     def generate_txt(self, resume_data: Dict, filename: Optional[str] = None) -> str:
         """
         Generate a plain text resume.
@@ -279,87 +357,147 @@ class ResumeGenerator:
         Returns:
             Path to generated TXT file
         """
+        resume_data = self._parse_resume_cached(resume_data)
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.txt"
+            filename = f"{default_basename()}.txt"
         
         filepath = self.output_dir / filename
         
-        lines = []
+        # Stream lines to the file; the first line carries no separator
+        lines = self._iter_txt_lines(resume_data)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(next(lines, ''))
+            f.writelines("\n" + line for line in lines)
         
+        return str(filepath)
+    
+    def _iter_txt_lines(self, resume_data: Dict):
+        """Yield the lines of the plain text resume, without line endings."""
         # Add name/title
         if 'name' in resume_data:
-            lines.append(resume_data['name'].upper())
-            lines.append("=" * len(resume_data['name']))
-            lines.append("")
+            yield resume_data['name'].upper()
+            yield "=" * len(resume_data['name'])
+            yield ""
         
         # Add contact info
         if 'email' in resume_data or 'phone' in resume_data:
-            contact = []
-            if resume_data.get('email'):
-                contact.append(f"Email: {resume_data['email']}")
-            if resume_data.get('phone'):
-                contact.append(f"Phone: {resume_data['phone']}")
-            if resume_data.get('location'):
-                contact.append(f"Location: {resume_data['location']}")
-            
-            lines.extend(contact)
-            lines.append("")
+            for label, value in resume_data['_contact']:
+                yield f"{label}: {value}"
+            yield ""
         
         # Add summary
         if resume_data.get('summary'):
-            lines.append("PROFESSIONAL SUMMARY")
-            lines.append("-" * 20)
-            lines.append(resume_data['summary'])
-            lines.append("")
+            yield "PROFESSIONAL SUMMARY"
+            yield "-" * 20
+            yield resume_data['summary']
+            yield ""
         
         # Add experience
         if resume_data.get('experience'):
-            lines.append("WORK EXPERIENCE")
-            lines.append("-" * 15)
-            experiences = self._parse_json_field(resume_data['experience'])
+            yield "WORK EXPERIENCE"
+            yield "-" * 15
+            experiences = resume_data['experience']
             for exp in experiences:
-                if isinstance(exp, dict):
-                    lines.append(exp.get('title', ''))
-                    for desc in exp.get('description', []):
-                        lines.append(f"  • {desc}")
-                    lines.append("")
+                yield exp.get('title', '')
+                for desc in exp.get('description', []):
+                    yield f"  • {desc}"
+                yield ""
         
         # Add education
         if resume_data.get('education'):
-            lines.append("EDUCATION")
-            lines.append("-" * 9)
-            educations = self._parse_json_field(resume_data['education'])
+            yield "EDUCATION"
+            yield "-" * 9
+            educations = resume_data['education']
             for edu in educations:
-                if isinstance(edu, dict):
-                    lines.append(edu.get('title', ''))
-                    for desc in edu.get('description', []):
-                        lines.append(f"  {desc}")
-                    lines.append("")
+                yield edu.get('title', '')
+                for desc in edu.get('description', []):
+                    yield f"  {desc}"
+                yield ""
         
         # Add skills
         if resume_data.get('skills'):
-            lines.append("SKILLS")
-            lines.append("-" * 6)
-            skills = self._parse_json_field(resume_data['skills'])
+            yield "SKILLS"
+            yield "-" * 6
+            skills = resume_data['skills']
             if isinstance(skills, list):
-                lines.append(", ".join(skills))
+                yield ", ".join(skills)
             else:
-                lines.append(str(skills))
-            lines.append("")
+                yield str(skills)
+            yield ""
+    
+    def generate_all(
+        self,
+        resume_data: Dict,
+        formats: Sequence[str] = ('pdf', 'docx', 'txt'),
+        basename: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Generate a resume in several formats, parsing its JSON fields once.
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        The formats are built concurrently on a format_executor pool and
+        share the parsed data read-only.
         
-        return str(filepath)
+        Args:
+            resume_data: Dictionary containing resume content
+            formats: Formats to generate ('pdf', 'docx' and/or 'txt')
+            basename: Optional file stem shared by all generated files
+            
+        Returns:
+            Dictionary mapping each format to its generated file path
+        """
+        generators = {
+            'pdf': self.generate_pdf,
+            'docx': self.generate_docx,
+            'txt': self.generate_txt,
+        }
+        for fmt in formats:
+            if fmt not in generators:
+                raise ValueError(f"Unsupported resume format: {fmt}")
+        
+        resume_data = self._parse_resume_cached(resume_data)
+        if not basename:
+            basename = default_basename()
+        
+        with format_executor(max(len(formats), 1)) as executor:
+            futures = {
+                fmt: executor.submit(generators[fmt], resume_data, f"{basename}.{fmt}")
+                for fmt in formats
+            }
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    def _parse_resume_cached(self, resume_data: Dict) -> Dict:
+        """
+        Return a copy of resume_data with its JSON fields parsed.
+        
+        Parsed values pass through _parse_json_field untouched, so data that
+        generate_all has already prepared is not decoded a second time. Entry
+        sections keep only their dict entries, so the renderers need no type
+        checks, and the contact details every format prints are collected
+        under '_contact'.
+        """
+        parsed = dict(resume_data)
+        for key in _JSON_FIELDS:
+            if parsed.get(key):
+                parsed[key] = self._parse_json_field(parsed[key])
+        for key in _ENTRY_FIELDS:
+            if parsed.get(key):
+                parsed[key] = [entry for entry in parsed[key] if isinstance(entry, dict)]
+        parsed['_contact'] = self._contact_parts(parsed)
+        return parsed
+    
+    @staticmethod
+    def _contact_parts(resume_data: Dict) -> tuple:
+        """Return the (label, value) pairs of the filled-in contact fields."""
+        return tuple(
+            (label, resume_data[key]) for key, label in _CONTACT_FIELDS if resume_data.get(key)
+        )
     
     def _parse_json_field(self, field):
         """Parse a field that might be JSON string or already parsed."""
         if isinstance(field, str):
             try:
-                return json.loads(field)
-            except:
+                return _json_loads(field)
+            except ValueError:  # also covers orjson.JSONDecodeError
                 return field
         return field
 
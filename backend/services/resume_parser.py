@@ -1,10 +1,83 @@
 """Resume parsing service."""
 import json
 import re
-from typing import Dict, List, Optional
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
-import PyPDF2
-from docx import Document
+
+# PDF and XML libraries are imported on first use, so a worker that only
+# parses plain text never loads them
+_LAZY = {}
+
+# PDFium is not thread-safe: no two calls may run at once, even on different
+# documents, so every PDFium session is serialized through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdf_lib() -> SimpleNamespace:
+    """Import a PDF text backend on first use: pypdfium2 if installed, else PyPDF2."""
+    lib = _LAZY.get('pdf')
+    if lib is None:
+        try:
+            # PDFium (C++) extracts text several times faster than PyPDF2
+            import pypdfium2 as pdfium
+            lib = SimpleNamespace(pdfium=pdfium, PyPDF2=None)
+        except ImportError:
+            import PyPDF2
+            lib = SimpleNamespace(pdfium=None, PyPDF2=PyPDF2)
+        _LAZY['pdf'] = lib
+    return lib
+
+
+def _etree():
+    """Import lxml.etree on first use."""
+    etree = _LAZY.get('etree')
+    if etree is None:
+        from lxml import etree
+        _LAZY['etree'] = etree
+    return etree
+
+# Compiled once at import; these run for every line of every parsed resume
+_DATE_RE = re.compile(r'\d{4}|\d{1,2}/\d{4}|present|current', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_SKILL_SPLIT_RE = re.compile(r'[,\n]')
+
+# WordprocessingML tags read when streaming text out of a .docx
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_R = _W + 'r'
+_W_HYPERLINK = _W + 'hyperlink'
+_W_T = _W + 't'
+_W_BR = _W + 'br'
+_W_BR_TYPE = _W + 'type'
+
+# Other run children with a fixed text equivalent, as python-docx renders them
+_W_RUN_CHARS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+# Keyword vocabularies, matched as plain substrings of the lowercased text
+_TECH_KEYWORDS = (
+    'python', 'java', 'javascript', 'react', 'angular', 'vue',
+    'node', 'django', 'flask', 'spring', 'aws', 'azure', 'gcp',
+    'docker', 'kubernetes', 'sql', 'mongodb', 'postgresql',
+    'machine learning', 'ai', 'data science', 'agile', 'scrum',
+    'rest api', 'graphql', 'microservices', 'ci/cd', 'git'
+)
+_ACTION_WORDS = (
+    'developed', 'designed', 'implemented', 'created', 'built',
+    'led', 'managed', 'optimized', 'improved', 'increased',
+    'reduced', 'achieved', 'delivered', 'collaborated', 'coordinated',
+    'analyzed', 'architected', 'deployed', 'integrated', 'automated'
+)
 
 
 class ResumeParser:
@@ -20,6 +93,36 @@ class ResumeParser:
             'projects': ['projects', 'portfolio', 'work samples'],
             'certifications': ['certifications', 'certificates', 'licenses'],
         }
+        self._section_re, self._section_rank = self._build_section_matcher(self.sections)
+    
+    @staticmethod
+    def _build_section_matcher(sections: Dict[str, List[str]]):
+        """
+        Compile the section keywords into one overlapping-match scan.
+        
+        A line belongs to the first section (in ``sections`` order) with any
+        keyword in it. The scan reports the longest keyword starting at each
+        position, so each keyword is ranked by the earliest section among all
+        keywords it contains; shorter keywords hidden inside it still count.
+        
+        Returns:
+            Tuple of (pattern, (rank, section name) by keyword)
+        """
+        owner = {}
+        for section_name, keywords in sections.items():
+            for keyword in keywords:
+                owner.setdefault(keyword, section_name)
+        
+        order = list(sections)
+        rank = {
+            keyword: min(
+                (order.index(section_name), section_name)
+                for other, section_name in owner.items() if other in keyword
+            )
+            for keyword in owner
+        }
+        alternation = '|'.join(map(re.escape, sorted(owner, key=len, reverse=True)))
+        return re.compile('(?=(' + alternation + '))'), rank
     
     def parse_file(self, file_path: str) -> Dict:
         """
@@ -34,14 +137,10 @@ class ResumeParser:
         file_path = Path(file_path)
         extension = file_path.suffix.lower()
         
-        if extension == '.pdf':
-            text = self._extract_pdf_text(file_path)
-        elif extension == '.docx':
-            text = self._extract_docx_text(file_path)
-        elif extension == '.txt':
-            text = self._extract_txt_text(file_path)
-        else:
+        extractor = self._EXTRACTORS.get(extension)
+        if extractor is None:
             raise ValueError(f"Unsupported file format: {extension}")
+        text = getattr(self, extractor)(file_path)
         
         # Parse the text into sections
         parsed_data = self._parse_text(text)
@@ -49,35 +148,126 @@ class ResumeParser:
         
         return parsed_data
     
+    def parse_files(self, file_paths: Sequence[str], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Parse several resume files concurrently.
+        
+        File reads, zip inflation and lxml parsing release the GIL, so DOCX and
+        TXT extraction overlaps on a thread pool. PDFium must not be entered
+        from two threads at once, so PDFs are still read one at a time.
+        
+        Args:
+            file_paths: Paths to the resume files
+            max_workers: Optional thread pool size
+            
+        Returns:
+            Parsed resume data for each file, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_file, file_paths))
+    
     def _extract_pdf_text(self, file_path: Path) -> str:
         """Extract text from PDF file."""
-        text = ""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            pages = [page_text for page_text in self._iter_pdf_pages(file_path) if page_text]
         except Exception as e:
             print(f"Error extracting PDF text: {e}")
             raise
         
-        return text.strip()
+        return "\n".join(pages).strip()
+    
+    def _iter_pdf_pages(self, file_path: Path):
+        """Yield the text of each PDF page, using PDFium when it is installed."""
+        lib = _pdf_lib()
+        if lib.pdfium is not None:
+            # Read every page under the lock, closing each PDFium handle
+            # explicitly rather than leaving it to a finalizer on whatever
+            # thread collects it; holding the lock across yields would leave
+            # it taken if the caller stopped iterating early
+            pages = []
+            with _PDFIUM_LOCK:
+                pdf = lib.pdfium.PdfDocument(str(file_path))
+                try:
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        pages.append(textpage.get_text_range())
+                        textpage.close()
+                        page.close()
+                finally:
+                    pdf.close()
+            for page_text in pages:
+                # PDFium ends lines with \r\n; the parser splits on \n
+                yield page_text.replace('\r\n', '\n')
+        else:
+            with open(file_path, 'rb') as file:
+                for page in lib.PyPDF2.PdfReader(file).pages:
+                    yield page.extract_text()
     
     def _extract_docx_text(self, file_path: Path) -> str:
-        """Extract text from DOCX file."""
-        doc = Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
+        """
+        Extract text from DOCX file.
+        
+        The document XML is streamed with iterparse instead of loading the
+        python-docx object model. Like ``Document.paragraphs``, only top-level
+        body paragraphs are read, and each is rendered as ``Paragraph.text``
+        would render it.
+        """
+        paragraphs = []
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open(self._docx_document_part(archive)) as xml:
+                for _, element in _etree().iterparse(xml, tag=_W_P):
+                    if element.getparent().tag == _W_BODY:
+                        paragraphs.append(self._docx_paragraph_text(element))
+                        element.clear(keep_tail=True)
+        return "\n".join(paragraphs).strip()
+    
+    @staticmethod
+    def _docx_document_part(archive: zipfile.ZipFile) -> str:
+        """Return the archive member holding the main document body."""
+        rels = _etree().fromstring(archive.read('_rels/.rels'))
+        for rel in rels:
+            if rel.get('Type', '').endswith('/officeDocument'):
+                return rel.get('Target').lstrip('/')
+        return 'word/document.xml'
+    
+    @staticmethod
+    def _docx_paragraph_text(paragraph) -> str:
+        """Text of a <w:p> element, including runs nested in hyperlinks."""
+        parts = []
+        for child in paragraph:
+            if child.tag == _W_R:
+                runs = (child,)
+            elif child.tag == _W_HYPERLINK:
+                runs = child.iterchildren(_W_R)
+            else:
+                continue
+            
+            for run in runs:
+                for item in run:
+                    tag = item.tag
+                    if tag == _W_T:
+                        parts.append(item.text or '')
+                    elif tag == _W_BR:
+                        # Page and column breaks have no text equivalent
+                        if item.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif tag in _W_RUN_CHARS:
+                        parts.append(_W_RUN_CHARS[tag])
+        return ''.join(parts)
     
     def _extract_txt_text(self, file_path: Path) -> str:
         """Extract text from TXT file."""
         with open(file_path, 'r', encoding='utf-8') as file:
             return file.read().strip()
     
+    # Text extractor method for each supported (lowercase) file extension,
+    # looked up by name so subclasses can override it
+    _EXTRACTORS = {
+        '.pdf': '_extract_pdf_text',
+        '.docx': '_extract_docx_text',
+        '.txt': '_extract_txt_text',
+    }
+    
     def _parse_text(self, text: str) -> Dict:
         """
         Parse resume text into structured sections.
@@ -88,7 +278,11 @@ class ResumeParser:
         Returns:
             Dictionary with parsed sections
         """
+        # Lowercased once; lowering never adds or removes newlines, so the
+        # two line lists stay aligned
+        text_lower = text.lower()
         lines = text.split('\n')
+        lines_lower = text_lower.split('\n')
         
         # Initialize data structure
         data = {
@@ -103,23 +297,19 @@ class ResumeParser:
         current_section = None
         current_content = []
         
-        for line in lines:
-            line_lower = line.lower().strip()
+        for line, line_lower in zip(lines, lines_lower):
+            line_lower = line_lower.strip()
             
             # Check if this line is a section header
-            section_found = False
-            for section_name, keywords in self.sections.items():
-                if any(keyword in line_lower for keyword in keywords):
-                    # Save previous section
-                    if current_section and current_content:
-                        self._save_section(data, current_section, current_content)
-                    
-                    current_section = section_name
-                    current_content = []
-                    section_found = True
-                    break
-            
-            if not section_found and line.strip():
+            section_name = self._match_section(line_lower)
+            if section_name:
+                # Save previous section
+                if current_section and current_content:
+                    self._save_section(data, current_section, current_content)
+                
+                current_section = section_name
+                current_content = []
+            elif line.strip():
                 current_content.append(line.strip())
         
         # Save last section
@@ -127,13 +317,17 @@ class ResumeParser:
             self._save_section(data, current_section, current_content)
         
         # Extract additional information
-        data['keywords'] = self._extract_keywords(text)
-        data['action_words'] = self._extract_action_words(text)
-        data['email'] = self._extract_email(text)
-        data['phone'] = self._extract_phone(text)
+        data['keywords'] = self._extract_keywords(text_lower)
+        data['action_words'] = self._extract_action_words(text_lower)
+        data['email'], data['phone'] = self._extract_contacts(text)
         
         return data
     
+    def _match_section(self, line_lower: str) -> Optional[str]:
+        """Return the section a lowercased line is a header for, if any."""
+        matches = [self._section_rank[m.group(1)] for m in self._section_re.finditer(line_lower)]
+        return min(matches)[1] if matches else None
+    
     def _save_section(self, data: Dict, section: str, content: List[str]):
         """Save parsed section content."""
         if section in ['summary']:
@@ -142,7 +336,7 @@ class ResumeParser:
             # Parse skills (comma or newline separated)
             skills = []
             for line in content:
-                skills.extend([s.strip() for s in re.split(r'[,\n]', line) if s.strip()])
+                skills.extend([s.strip() for s in _SKILL_SPLIT_RE.split(line) if s.strip()])
             data[section] = skills
         elif section in ['experience', 'education', 'projects', 'certifications']:
             # Parse structured entries
@@ -172,50 +366,36 @@ class ResumeParser:
     def _looks_like_entry_header(self, line: str) -> bool:
         """Check if a line looks like an entry header."""
         # Heuristics for detecting entry headers
-        date_pattern = r'\d{4}|\d{1,2}/\d{4}|present|current'
-        return bool(re.search(date_pattern, line, re.IGNORECASE))
+        return bool(_DATE_RE.search(line))
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract important keywords from resume."""
+    def _extract_keywords(self, text_lower: str) -> List[str]:
+        """Extract important keywords from lowercased resume text."""
         # Simple keyword extraction (in production, use NLP models)
-        common_tech_keywords = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue',
-            'node', 'django', 'flask', 'spring', 'aws', 'azure', 'gcp',
-            'docker', 'kubernetes', 'sql', 'mongodb', 'postgresql',
-            'machine learning', 'ai', 'data science', 'agile', 'scrum',
-            'rest api', 'graphql', 'microservices', 'ci/cd', 'git'
-        ]
-        
-        text_lower = text.lower()
-        found_keywords = [kw for kw in common_tech_keywords if kw in text_lower]
-        
-        return found_keywords
+        return [kw for kw in _TECH_KEYWORDS if kw in text_lower]
     
-    def _extract_action_words(self, text: str) -> List[str]:
-        """Extract action words/verbs from resume."""
-        action_words = [
-            'developed', 'designed', 'implemented', 'created', 'built',
-            'led', 'managed', 'optimized', 'improved', 'increased',
-            'reduced', 'achieved', 'delivered', 'collaborated', 'coordinated',
-            'analyzed', 'architected', 'deployed', 'integrated', 'automated'
-        ]
+    def _extract_action_words(self, text_lower: str) -> List[str]:
+        """Extract action words/verbs from lowercased resume text."""
+        # The vocabulary has no duplicates, so no set() pass is needed
+        return [word for word in _ACTION_WORDS if word in text_lower]
+    
+    def _extract_contacts(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract the first email address and phone number from text.
         
-        text_lower = text.lower()
-        found_words = [word for word in action_words if word in text_lower]
+        The email search is the expensive one, so it is skipped when the text
+        has no '@' and otherwise starts at the whitespace-delimited token
+        holding the first '@': no address can begin before it.
+        """
+        email = None
+        at = text.find('@')
+        if at != -1:
+            start = max(text.rfind(' ', 0, at), text.rfind('\n', 0, at), 0)
+            match = _EMAIL_RE.search(text, start)
+            email = match.group(0) if match else None
         
-        return list(set(found_words))
-    
-    def _extract_email(self, text: str) -> Optional[str]:
-        """Extract email address from text."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
-        return match.group(0) if match else None
-    
-    def _extract_phone(self, text: str) -> Optional[str]:
-        """Extract phone number from text."""
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        match = re.search(phone_pattern, text)
-        return match.group(0) if match else None
+        match = _PHONE_RE.search(text)
+        phone = match.group(0) if match else None
+        return email, phone
     
     def parse_text_content(self, text: str) -> Dict:
         """
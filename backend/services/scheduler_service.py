@@ -1,163 +1,251 @@
 """Job scheduler service for automated job fetching."""
 import asyncio
-from typing import Optional
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
-from sqlalchemy.orm import Session
+import json
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from sqlalchemy import Text, insert, type_coerce, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only
 from backend.core.database import SessionLocal
 from backend.services.job_api_service import UnifiedJobAPI
 from backend.services.nlp_analyzer import NLPAnalyzer
 from backend.models.job import Job
 from backend.models.user import User
-import json
+
+
+logger = logging.getLogger(__name__)
+
+
+def _decode_roles(raw_roles) -> List[str]:
+    """
+    Decode a user's stored target roles.
+    
+    SQLite hands back the JSON text, while PostgreSQL drivers may already have
+    decoded it. Malformed JSON or anything other than a list yields no roles.
+    """
+    if isinstance(raw_roles, str):
+        try:
+            raw_roles = json.loads(raw_roles)
+        except ValueError:
+            return []
+    return raw_roles if isinstance(raw_roles, list) else []
 
 
 class JobScheduler:
     """Automated job fetching and processing scheduler."""
     
+    # Users whose jobs are fetched at the same time
+    FETCH_CONCURRENCY = 8
+    
     def __init__(self):
         """Initialize the scheduler."""
-        self.scheduler = AsyncIOScheduler()
+        self._tasks: List[asyncio.Task] = []
         self.job_api = UnifiedJobAPI()
         self.analyzer = NLPAnalyzer()
     
     def start(self):
-        """Start the scheduler."""
-        # Fetch jobs every 6 hours
-        self.scheduler.add_job(
-            self.fetch_jobs_for_all_users,
-            CronTrigger(hour='*/6'),  # Every 6 hours
-            id='fetch_jobs',
-            name='Fetch new jobs',
-            replace_existing=True
-        )
-        
-        # Daily cleanup of old jobs (30 days)
-        self.scheduler.add_job(
-            self.cleanup_old_jobs,
-            CronTrigger(hour=2, minute=0),  # 2 AM daily
-            id='cleanup_jobs',
-            name='Cleanup old jobs',
-            replace_existing=True
-        )
-        
-        self.scheduler.start()
-        print("✓ Job scheduler started")
+        """Start the scheduler (must be called from the running event loop)."""
+        self._tasks = [
+            # Fetch jobs every 6 hours (00:00, 06:00, 12:00, 18:00)
+            asyncio.create_task(self._every(6 * 3600, self.fetch_jobs_for_all_users)),
+            # Daily cleanup of old jobs (30 days) at 2 AM
+            asyncio.create_task(self._daily_at(2, 0, self.cleanup_old_jobs)),
+        ]
+        logger.info("✓ Job scheduler started")
     
     def stop(self):
         """Stop the scheduler."""
-        self.scheduler.shutdown()
-        print("✓ Job scheduler stopped")
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self.job_api.close()
+        logger.info("✓ Job scheduler stopped")
+    
+    async def _every(self, seconds: int, job: Callable[[], Awaitable[None]]):
+        """Run a job at every multiple of ``seconds`` past local midnight."""
+        while True:
+            now = datetime.now()
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            elapsed = (now - midnight).total_seconds()
+            next_run = midnight + timedelta(seconds=(elapsed // seconds + 1) * seconds)
+            await self._run_at(next_run, job)
+    
+    async def _daily_at(self, hour: int, minute: int, job: Callable[[], Awaitable[None]]):
+        """Run a job every day at the given local time."""
+        while True:
+            now = datetime.now()
+            when = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if when <= now:
+                when += timedelta(days=1)
+            await self._run_at(when, job)
+    
+    @staticmethod
+    async def _run_at(when: datetime, job: Callable[[], Awaitable[None]]):
+        """Sleep until ``when``, then run the job; errors don't stop its loop."""
+        await asyncio.sleep(max((when - datetime.now()).total_seconds(), 0))
+        try:
+            await job()
+        except Exception as e:
+            logger.error("Scheduled job %s failed: %s", job.__name__, e)
     
     async def fetch_jobs_for_all_users(self):
         """Fetch jobs for all active users based on their preferences."""
-        db = SessionLocal()
-        
         try:
-            # Get all active users with target roles
-            users = db.query(User).filter(
-                User.is_active == True,
-                User.target_roles.isnot(None)
-            ).all()
+            # Read-only, so the session just closes without committing
+            # (a commit would expire the loaded users)
+            with SessionLocal() as db:
+                # Get all active users with target roles, loading only the
+                # columns the fetch needs; the roles come back undecoded so
+                # one malformed row skips that user instead of failing the query
+                rows = db.query(
+                    User, type_coerce(User.target_roles, Text)
+                ).options(
+                    load_only(User.username)
+                ).filter(
+                    User.is_active == True,
+                    User.target_roles.isnot(None)
+                ).all()
             
-            print(f"Fetching jobs for {len(users)} users...")
+            users = []
+            for user, raw_roles in rows:
+                target_roles = _decode_roles(raw_roles)
+                if target_roles:
+                    users.append((user, target_roles))
             
-            for user in users:
-                await self._fetch_jobs_for_user(user, db)
-                # Add delay between users
-                await asyncio.sleep(5)
+            logger.info("Fetching jobs for %d users...", len(users))
             
         except Exception as e:
-            print(f"Error in scheduled job fetch: {e}")
-        finally:
-            db.close()
+            logger.error("Error in scheduled job fetch: %s", e)
+            return
+        
+        # Users are independent, so their fetches overlap, bounded by the
+        # semaphore; UnifiedJobAPI's limiters pace the upstream requests
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        
+        async def fetch(user: User, target_roles: List[str]):
+            async with semaphore:
+                await self._fetch_jobs_for_user(user, target_roles)
+        
+        await asyncio.gather(*(fetch(user, target_roles) for user, target_roles in users))
     
-    async def _fetch_jobs_for_user(self, user: User, db: Session):
+    async def _fetch_jobs_for_user(self, user: User, target_roles: List[str]):
         """Fetch jobs for a specific user."""
         try:
-            # Parse user preferences
-            target_roles = json.loads(user.target_roles) if user.target_roles else []
-            
-            if not target_roles:
-                return
+            # Fallback posting date for every job fetched in this run
+            now = datetime.utcnow()
             
             # Fetch jobs for each target role
-            for role in target_roles[:3]:  # Limit to 3 roles per user
-                jobs_data = self.job_api.search_all_sources(
+            roles = target_roles[:3]  # Limit to 3 roles per user
+            jobs_data = []
+            for role in roles:
+                # The job APIs use blocking HTTP; run them off the event loop
+                jobs_data += await asyncio.to_thread(
+                    self.job_api.search_all_sources,
                     keywords=role,
                     location="",  # Can be customized per user
                     limit=20
                 )
-                
-                # Save jobs to database
-                for job_data in jobs_data:
-                    # Check if job already exists
-                    existing = db.query(Job).filter(
-                        Job.external_id == job_data.get('external_id')
-                    ).first()
-                    
-                    if existing:
-                        continue
-                    
-                    # Analyze job description
-                    job_analysis = self.analyzer.analyze_job_description(
-                        job_data.get('description', '')
-                    )
-                    
-                    # Create new job
-                    new_job = Job(
-                        title=job_data['title'],
-                        company=job_data['company'],
-                        location=job_data.get('location'),
-                        job_type=job_data.get('job_type'),
-                        description=job_data['description'],
-                        source=job_data.get('source', 'API'),
-                        source_url=job_data.get('source_url'),
-                        external_id=job_data.get('external_id'),
-                        keywords=json.dumps(job_analysis.get('all_keywords', [])),
-                        required_skills=json.dumps(job_analysis.get('required_skills', [])),
-                        preferred_skills=json.dumps(job_analysis.get('preferred_skills', [])),
-                        action_words=json.dumps(job_analysis.get('action_words', [])),
-                        salary_range=job_data.get('salary_range'),
-                        posted_date=job_data.get('posted_date', datetime.utcnow()),
+            
+            # Drop repeats within the batch first; jobs without an
+            # external_id could never be deduplicated, so skip them too
+            batch = {}
+            for job_data in jobs_data:
+                external_id = job_data.get('external_id')
+                if external_id and external_id not in batch:
+                    batch[external_id] = job_data
+            
+            # Each user gets its own session (they are not safe to share
+            # between concurrent fetches), opened only after the awaited
+            # searches: one transaction that commits on success, rolls back
+            # on error and returns its connection to the pool right away
+            with SessionLocal.begin() as db:
+                # One lookup for every external_id already stored, so known
+                # jobs skip analysis; the insert below still ignores conflicts
+                existing_ids = {
+                    external_id for (external_id,) in db.query(Job.external_id).filter(
+                        Job.external_id.in_(list(batch))
                     )
-                    
-                    db.add(new_job)
+                }
                 
-                db.commit()
-                print(f"  Added {len(jobs_data)} jobs for role: {role}")
+                new_jobs = [
+                    job_data for external_id, job_data in batch.items()
+                    if external_id not in existing_ids
+                ]
                 
-                # Delay between searches
-                await asyncio.sleep(2)
+                # Analyze all new job descriptions in one batch
+                analyses = self.analyzer.analyze_many(
+                    [job_data.get('description', '') for job_data in new_jobs]
+                )
                 
+                rows = [
+                    {
+                        'title': job_data['title'],
+                        'company': job_data['company'],
+                        'location': job_data.get('location'),
+                        'job_type': job_data.get('job_type'),
+                        'description': job_data['description'],
+                        'source': job_data.get('source', 'API'),
+                        'source_url': job_data.get('source_url'),
+                        'external_id': job_data.get('external_id'),
+                        'keywords': job_analysis.get('all_keywords', []),
+                        'required_skills': job_analysis.get('required_skills', []),
+                        'preferred_skills': job_analysis.get('preferred_skills', []),
+                        'action_words': job_analysis.get('action_words', []),
+                        'salary_range': job_data.get('salary_range'),
+                        'posted_date': job_data.get('posted_date') or now,
+                    }
+                    for job_data, job_analysis in zip(new_jobs, analyses)
+                ]
+                
+                # Save jobs to database in a single executemany
+                added = self._insert_new_jobs(db, rows) if rows else 0
+            
+            logger.info("  Added %d jobs for roles: %s", added, ', '.join(roles))
+            
         except Exception as e:
-            print(f"Error fetching jobs for user {user.username}: {e}")
+            logger.error("Error fetching jobs for user %s: %s", user.username, e)
+    
+    def _insert_new_jobs(self, db: Session, rows: List[Dict]) -> int:
+        """
+        Insert job rows, skipping any whose external_id is already stored.
+        
+        The database resolves the conflict, so two concurrent fetches that
+        both miss the existence check cannot fail on the unique index.
+        
+        Returns:
+            Number of rows inserted
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == 'postgresql':
+            stmt = pg_insert(Job.__table__).on_conflict_do_nothing(index_elements=['external_id'])
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(Job.__table__).on_conflict_do_nothing(index_elements=['external_id'])
+        else:
+            stmt = insert(Job.__table__)
+        return db.execute(stmt, rows).rowcount
     
     async def cleanup_old_jobs(self):
         """Remove job postings older than 30 days."""
-        db = SessionLocal()
-        
         try:
-            from datetime import timedelta
             thirty_days_ago = datetime.utcnow() - timedelta(days=30)
             
-            # Mark old jobs as inactive instead of deleting
-            old_jobs = db.query(Job).filter(
-                Job.posted_date < thirty_days_ago,
-                Job.is_active == True
-            ).all()
-            
-            for job in old_jobs:
-                job.is_active = False
+            # Mark old jobs as inactive instead of deleting, in one
+            # server-side UPDATE rather than loading every row
+            with SessionLocal.begin() as db:
+                result = db.execute(
+                    update(Job).where(
+                        Job.posted_date < thirty_days_ago,
+                        Job.is_active == True
+                    ).values(is_active=False)
+                )
             
-            db.commit()
-            print(f"Cleaned up {len(old_jobs)} old jobs")
+            logger.info("Cleaned up %d old jobs", result.rowcount)
             
         except Exception as e:
-            print(f"Error in cleanup: {e}")
-        finally:
-            db.close()
+            logger.error("Error in cleanup: %s", e)
 
 
 class ApplicationQueue:
@@ -165,7 +253,8 @@ class ApplicationQueue:
     
     def __init__(self):
         """Initialize application queue."""
-        self.queue = []
+        # FIFO; a deque pops from the front in O(1) where list.pop(0) is O(n)
+        self.queue = deque()
         self.processing = False
     
     async def add_application(
@@ -187,26 +276,27 @@ class ApplicationQueue:
     async def process_queue(self):
         """Process applications in the queue with rate limiting."""
         if self.processing:
-            print("Queue is already being processed")
+            logger.info("Queue is already being processed")
             return
         
         self.processing = True
-        auto_apply = AutoApplyService()
         
         try:
-            from backend.services.auto_apply_service import rate_limiter
+            from backend.services.auto_apply_service import AutoApplyService, rate_limiter
+            
+            auto_apply = AutoApplyService()
             
             while self.queue and rate_limiter.can_apply():
-                application_data = self.queue.pop(0)
+                application_data = self.queue.popleft()
                 
                 # Check rate limit
                 remaining = rate_limiter.get_remaining()
                 if remaining <= 0:
-                    print(f"Daily limit reached. {len(self.queue)} applications remain in queue.")
+                    logger.info("Daily limit reached. %d applications remain in queue.", len(self.queue))
                     break
                 
                 # Process application
-                print(f"Processing application {application_data['job_url']} ({remaining} remaining today)")
+                logger.info("Processing application %s (%d remaining today)", application_data['job_url'], remaining)
                 
                 result = await auto_apply.apply_to_linkedin_job(
                     job_url=application_data['job_url'],
@@ -216,20 +306,20 @@ class ApplicationQueue:
                 
                 if result['success']:
                     rate_limiter.record_application()
-                    print(f"  ✓ Application prepared successfully")
+                    logger.info("  ✓ Application prepared successfully")
                 else:
-                    print(f"  ✗ Application failed: {result['message']}")
+                    logger.warning("  ✗ Application failed: %s", result['message'])
                 
                 # Random delay between applications
                 delay = auto_apply.get_random_delay()
-                print(f"  Waiting {delay} seconds before next application...")
+                logger.info("  Waiting %d seconds before next application...", delay)
                 await asyncio.sleep(delay)
             
             if self.queue:
-                print(f"{len(self.queue)} applications remain in queue for tomorrow")
+                logger.info("%d applications remain in queue for tomorrow", len(self.queue))
                 
         except Exception as e:
-            print(f"Error processing queue: {e}")
+            logger.error("Error processing queue: %s", e)
         finally:
             self.processing = False
 
@@ -0,0 +1,70 @@
+"""The trie-shaped skill matcher must agree with a word-boundary search per skill."""
+import random
+import re
+
+import pytest
+
+from backend.services.nlp_analyzer import NLPAnalyzer, _trie_pattern
+
+ANALYZER = NLPAnalyzer()
+
+SKILL_LISTS = {
+    'technical': ANALYZER.technical_skills,
+    'soft': ANALYZER.soft_skills,
+    'action': ANALYZER.action_verbs,
+}
+
+
+def _reference_skills(text: str, skill_list: list) -> list:
+    """Match each skill on its own, as _extract_skills originally did."""
+    return [
+        skill for skill in skill_list
+        if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)
+    ]
+
+
+def _random_texts(skill_list: list, count: int, seed: int) -> list:
+    """Texts built from skills, near-miss variants, and separators."""
+    rng = random.Random(seed)
+    fragments = [
+        variant
+        for skill in skill_list
+        for variant in (skill, skill[:-1], skill + 's', skill.upper(), skill.title())
+    ] + ['ic', 'ing', 'api', ' api', 'x', '_', '']
+    separators = ['', ' ', ' ', '-', '.', ',', '+', '/', '\n']
+    return [
+        ''.join(rng.choice(fragments) + rng.choice(separators) for _ in range(rng.randint(1, 12)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('name', SKILL_LISTS)
+def test_matches_per_skill_search(name):
+    skill_list = SKILL_LISTS[name]
+    for text in _random_texts(skill_list, 3000, seed=len(name)):
+        assert ANALYZER._extract_skills(text, skill_list) == _reference_skills(text, skill_list), text
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Python and pythonic code', ['python']),
+    ('pythonic only', []),
+    ('REST API design', ['rest api', 'rest']),
+    ('rest', ['rest']),
+    # The trailing word boundary never follows a symbol before a space,
+    # so 'c++'/'c#' only match right before a word character
+    ('c++ and c# with node.js', ['node.js']),
+    ('c++11', ['c++']),
+    ('Machine Learning, CI/CD', ['machine learning', 'ci/cd']),
+])
+def test_known_cases(text, expected):
+    skill_list = ['python', 'rest', 'rest api', 'c++', 'c#', 'node.js', 'machine learning', 'ci/cd']
+    found = ANALYZER._extract_skills(text, skill_list)
+    assert found == _reference_skills(text, skill_list)
+    assert sorted(found) == sorted(expected)
+
+
+def test_trie_pattern_prefers_longest_word():
+    pattern = re.compile(_trie_pattern(['go', 'golang', 'gol']))
+    assert pattern.match('golang').group() == 'golang'
+    assert pattern.match('gol ').group() == 'gol'
+    assert pattern.match('gola') is None
@@ -0,0 +1,111 @@
+"""ResumeGenerator.generate_docx must match the python-docx output it replaced."""
+import zipfile
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, RGBColor
+
+from backend.services.resume_generator import ResumeGenerator
+
+
+def _reference_docx(generator: ResumeGenerator, resume_data: dict, filepath) -> None:
+    """Build the resume with python-docx, as generate_docx used to."""
+    resume_data = generator._parse_resume_cached(resume_data)
+    doc = Document()
+    
+    for section in doc.sections:
+        section.top_margin = Inches(0.5)
+        section.bottom_margin = Inches(0.5)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+    
+    if 'name' in resume_data or 'title' in resume_data:
+        heading = doc.add_heading(resume_data.get('name', 'Your Name'), level=1)
+        heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        heading.runs[0].font.color.rgb = RGBColor(0, 0, 128)
+    
+    if 'email' in resume_data or 'phone' in resume_data:
+        contact_para = doc.add_paragraph(" | ".join(value for _, value in resume_data['_contact']))
+        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    doc.add_paragraph()
+    
+    if resume_data.get('summary'):
+        doc.add_heading('PROFESSIONAL SUMMARY', level=2)
+        doc.add_paragraph(resume_data['summary'])
+    
+    for key, heading, bullet_style in (
+        ('experience', 'WORK EXPERIENCE', 'List Bullet'),
+        ('education', 'EDUCATION', None),
+    ):
+        if resume_data.get(key):
+            doc.add_heading(heading, level=2)
+            for entry in resume_data[key]:
+                doc.add_paragraph().add_run(entry.get('title', '')).bold = True
+                for desc in entry.get('description', []):
+                    doc.add_paragraph(desc, style=bullet_style)
+    
+    if resume_data.get('skills'):
+        doc.add_heading('SKILLS', level=2)
+        skills = resume_data['skills']
+        doc.add_paragraph(" • ".join(skills) if isinstance(skills, list) else str(skills))
+    
+    if resume_data.get('projects'):
+        doc.add_heading('PROJECTS', level=2)
+        for proj in resume_data['projects']:
+            doc.add_paragraph().add_run(proj.get('title', '')).bold = True
+            for desc in proj.get('description', []):
+                doc.add_paragraph(desc, style='List Bullet')
+    
+    doc.save(str(filepath))
+
+
+RESUMES = [
+    pytest.param({
+        'name': 'Ann Lee',
+        'email': 'ann@example.com',
+        'phone': '555-0100',
+        'summary': 'Backend engineer.',
+        'experience': [
+            {'title': 'Engineer, Acme', 'description': ['Built APIs', 'Led a team of 4']},
+            {'title': 'Intern'},
+        ],
+        'education': '[{"title": "BS Computer Science", "description": ["GPA 3.9"]}]',
+        'skills': '["Python", "SQL", "Docker"]',
+        'projects': [{'title': 'Portfolio', 'description': ['React + GraphQL']}],
+    }, id='full'),
+    pytest.param({'title': 'Developer'}, id='title-only'),
+    pytest.param({'email': 'x@example.com', 'skills': 'not json'}, id='skills-text'),
+    pytest.param({
+        'name': '  Zoë <O\'Brien> & Co  ',
+        'phone': '+1 (555) 0100',
+        'summary': 'Line one\nline two\twith tab\r\nand CRLF  ',
+        'experience': [{'title': 'R&D <lead>', 'description': [' padded ', '', 'a b – c']}],
+        'skills': ['C++', 'C#', '.NET'],
+    }, id='escaping-and-whitespace'),
+]
+
+
+@pytest.mark.parametrize('resume_data', RESUMES)
+def test_docx_matches_python_docx(tmp_path, resume_data):
+    generator = ResumeGenerator(output_dir=str(tmp_path))
+    path = generator.generate_docx(dict(resume_data), 'new.docx')
+    _reference_docx(generator, dict(resume_data), tmp_path / 'old.docx')
+    
+    with zipfile.ZipFile(path) as new, zipfile.ZipFile(tmp_path / 'old.docx') as old:
+        assert new.namelist() == old.namelist()
+        for name in old.namelist():
+            # Core properties carry the save timestamp
+            if name != 'docProps/core.xml':
+                assert new.read(name) == old.read(name), name
+
+
+def test_docx_rejects_control_characters(tmp_path):
+    generator = ResumeGenerator(output_dir=str(tmp_path))
+    resume_data = {'name': 'Ann', 'summary': 'bad \x01 byte'}
+    
+    with pytest.raises(ValueError):
+        _reference_docx(generator, dict(resume_data), tmp_path / 'old.docx')
+    with pytest.raises(ValueError):
+        generator.generate_docx(dict(resume_data), 'new.docx')